@@ -10,44 +10,56 @@ Place this file at the project root (next to main.py) so `import common_defs`
 succeeds.
 """
 from pathlib import Path
-import os
 import shutil
 import json
 
+from core.utils import _iter_file_entries
+
+try:
+    import orjson  # optional, much faster for the big CARD_* arrays
+except ImportError:
+    orjson = None
+
+# resolve() does a realpath walk on the filesystem; do it once at import
+_SCRIPT_FOLDER = str(Path(__file__).resolve().parent)
+
 # Basic helpers -------------------------------------------------------------
 def script_folder() -> str:
-    return str(Path(__file__).resolve().parent)
+    return _SCRIPT_FOLDER
 
 def copy_and_replace(source_path, destination_path):
     src = Path(source_path)
     dst = Path(destination_path)
     dst.parent.mkdir(parents=True, exist_ok=True)
-    if dst.exists():
-        dst.unlink()
+    # copy2 truncates/overwrites an existing destination itself
     shutil.copy2(src, dst)
 
 def file_walker(source_folder):
     """Yield file paths (strings) under source_folder recursively."""
-    source_folder = Path(source_folder)
-    for p in source_folder.rglob("*"):
-        if p.is_file():
-            yield str(p)
+    for entry in _iter_file_entries(source_folder):
+        yield entry.path
 
 def WriteJSON(obj, json_file_path: str):
+    # serialize in one go and hand the bytes to a single write(); json.dump would
+    # issue one small write per token. Stays on the stdlib encoder: orjson only
+    # indents by 2 and these files are written with 4.
+    data = json.dumps(obj, ensure_ascii=False, indent=4).encode('utf-8')
     Path(json_file_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(json_file_path, 'w', encoding='utf-8') as f:
-        json.dump(obj, f, ensure_ascii=False, indent=4)
+    with open(json_file_path, 'wb') as f:
+        f.write(data)
 
 def get_and_prime_json(file_path: str):
-    with open(file_path, encoding='utf-8') as f:
-        arr = json.load(f)
+    # slurp the raw bytes in few large reads; both parsers accept UTF-8 bytes
+    with open(file_path, 'rb', buffering=1 << 20) as f:
+        blob = f.read()
+    arr = (orjson or json).loads(blob)
     return arr
 
 # Project paths (used by GUI and helper scripts)
-ROOT = Path(script_folder())
+ROOT = Path(_SCRIPT_FOLDER)
 
 # These folder names are chosen to be unobtrusive and specific to this tool.
-# They will be created automatically when needed.
+# They are created by ensure_project_dirs() when needed.
 copied_files_folder = str(ROOT / "1_copied_game_files")
 decrypt_folder      = str(ROOT / "2_decrypted_assets")
 changed_folder      = str(ROOT / "3_changed_assets")
@@ -56,29 +68,39 @@ output_folder       = str(ROOT / "output")          # general output (GUI also u
 assets_folder       = str(ROOT / "assets")
 scripts_folder      = str(ROOT / "utils")           # kept for compatibility
 
+_DECRYPT = Path(decrypt_folder)
+_CHANGED = Path(changed_folder)
+
 # Additional likely-used decrypted/changed filenames (string paths)
-part_dec_path   = str(Path(decrypt_folder) / "Card_Part.bytes.dec")
-pidx_dec_path   = str(Path(decrypt_folder) / "Card_Pidx.bytes.dec")
-prop_dec_path   = str(Path(decrypt_folder) / "CARD_Prop.bytes.dec")
-word_dec_path   = str(Path(decrypt_folder) / "WORD_Text.bytes.dec")
-widx_dec_path   = str(Path(decrypt_folder) / "WORD_Indx.bytes.dec")
-font_asset_path = str(Path(decrypt_folder) / "CardPictureFontSetting.json")
-
-name_dec_path    = str(Path(decrypt_folder) / "CARD_Name.bytes.dec.json")
-desc_dec_path    = str(Path(decrypt_folder) / "CARD_Desc.bytes.dec.json")
-braced_save_path = str(Path(decrypt_folder) / "!Braced CARD_Desc.bytes.dec.json")
-
-changed_braced_path   = str(Path(changed_folder) / "!Changed !Braced CARD_Desc.bytes.dec.json")
-unbraced_changed_path = str(Path(changed_folder) / "!Unbraced !Changed CARD_Desc.bytes.dec.json")
-changed_part_path     = str(Path(changed_folder) / "!Changed Card_Part.bytes.dec")
-changed_font_path     = str(Path(changed_folder) / "!Changed CardPictureFontSetting.json")
-changed_word_path     = str(Path(changed_folder) / "!Changed WORD_Text.bytes.dec")
-changed_widx_path     = str(Path(changed_folder) / "!Changed WORD_Indx.bytes.dec")
-
-# Ensure directories exist for code that expects them
-for p in (copied_files_folder, decrypt_folder, changed_folder, modded_folder, output_folder, assets_folder, scripts_folder):
-    try:
-        Path(p).mkdir(parents=True, exist_ok=True)
-    except Exception:
-        # best-effort; ignore permissions errors here
-        pass
\ No newline at end of file
+part_dec_path   = str(_DECRYPT / "Card_Part.bytes.dec")
+pidx_dec_path   = str(_DECRYPT / "Card_Pidx.bytes.dec")
+prop_dec_path   = str(_DECRYPT / "CARD_Prop.bytes.dec")
+word_dec_path   = str(_DECRYPT / "WORD_Text.bytes.dec")
+widx_dec_path   = str(_DECRYPT / "WORD_Indx.bytes.dec")
+font_asset_path = str(_DECRYPT / "CardPictureFontSetting.json")
+
+name_dec_path    = str(_DECRYPT / "CARD_Name.bytes.dec.json")
+desc_dec_path    = str(_DECRYPT / "CARD_Desc.bytes.dec.json")
+braced_save_path = str(_DECRYPT / "!Braced CARD_Desc.bytes.dec.json")
+
+changed_braced_path   = str(_CHANGED / "!Changed !Braced CARD_Desc.bytes.dec.json")
+unbraced_changed_path = str(_CHANGED / "!Unbraced !Changed CARD_Desc.bytes.dec.json")
+changed_part_path     = str(_CHANGED / "!Changed Card_Part.bytes.dec")
+changed_font_path     = str(_CHANGED / "!Changed CardPictureFontSetting.json")
+changed_word_path     = str(_CHANGED / "!Changed WORD_Text.bytes.dec")
+changed_widx_path     = str(_CHANGED / "!Changed WORD_Indx.bytes.dec")
+
+_PROJECT_DIRS = tuple(Path(p) for p in (copied_files_folder, decrypt_folder, changed_folder, modded_folder,
+                                         output_folder, assets_folder, scripts_folder))
+
+def ensure_project_dirs():
+    """
+    Create the project folders above (if missing). Called by the entry points
+    that write into them (GUI startup, extraction) rather than on every import.
+    """
+    for p in _PROJECT_DIRS:
+        try:
+            p.mkdir(parents=True, exist_ok=True)
+        except Exception:
+            # best-effort; ignore permissions errors here
+            pass
@@ -11,9 +11,18 @@ Behavior:
 This makes searching many orders of magnitude faster in typical Master Duel installs.
 """
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 import UnityPy
+import bisect
+import gc
+import mmap
 import os
-from typing import List, Optional, Tuple
+import queue
+import re
+import stat
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from core.utils import _iter_file_entries
 
 # Default triples taken from your message: (search_term, expected_filename, expected_size)
 # expected_size set to 0 when unknown: named_search uses expected_filename only.
@@ -29,86 +38,246 @@ DEFAULT_SEARCH_TRIPLES: List[Tuple[str, str, int]] = [
     ("CardPictureFontSetting", "fcd008c9", 0),
 ]
 
-def is_correct_file(path, obj, search_term):
+# UnityPy envs keep the whole file plus parsed trees alive, so the per-session
+# cache only holds the most recently used files.
+ENV_CACHE_SIZE = 64
+
+# Brute force passes over at least this many files are spread over a process
+# pool (UnityPy parsing holds the GIL, so threads would not help).
+PARALLEL_MIN_FILES = 64
+
+# Serial brute force passes read the head of this many upcoming files ahead
+# of the parser (PREFETCH_BYTES each) to warm the page cache.
+PREFETCH_DEPTH = 8
+PREFETCH_BYTES = 1 << 16
+
+# The serial brute force pass runs a full gc.collect() every this many files.
+GC_EVERY = 64
+
+# Files smaller than this cannot hold any of the card assets and are never parsed.
+MIN_ASSET_SIZE = 1024
+
+def _load_mmap(file_path: str):
+    """
+    UnityPy.load over a read-only memory map of file_path instead of the path:
+    the file is not copied into a bytes object up front and only the pages
+    UnityPy actually touches (header, container table, the m_Name of the
+    candidates) are read from disk. The map stays alive as long as the env.
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        # the map holds its own handle
+        os.close(fd)
+    return UnityPy.load(mm)
+
+def _load_env(file_path, env_cache: Optional[Dict[str, object]] = None):
+    """
+    UnityPy.load(file_path), memoized in env_cache (if given) so a file that shows
+    up in several lookup phases is only parsed once. Returns None if the file is
+    not a loadable Unity asset; failures are cached too.
+    env_cache is kept in least-recently-used order (dicts preserve insertion
+    order, so a hit is moved to the end and eviction pops the front).
+    """
+    key = os.fspath(file_path)
+    if env_cache is not None and key in env_cache:
+        env = env_cache[key] = env_cache.pop(key)
+        return env
     try:
-        data = obj.read()
-        return getattr(data, "m_Name", "") == search_term
+        env = _load_mmap(key)
     except Exception:
-        return False
+        env = None
+    if env_cache is not None:
+        if len(env_cache) >= ENV_CACHE_SIZE:
+            env_cache.pop(next(iter(env_cache)))
+        env_cache[key] = env
+    return env
+
+# Optional step_1_config.txt at the project root, resolved once at import.
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_CFG_PATH = _REPO_ROOT / "step_1_config.txt"
 
-def named_search(path_0000: Path, search_term: str, expected_filename: str) -> Optional[dict]:
+# Object types the searched assets can have: TextAsset for CARD_*/WORD_*/Card_*,
+# MonoBehaviour for CardPictureFontSetting.
+TARGET_TYPES = frozenset(("TextAsset", "MonoBehaviour"))
+
+def _object_name(obj) -> Optional[str]:
     """
-    Direct lookup to 0000/<first2>/<expected_filename> which is much faster than scanning.
+    m_Name of a container object, or None if it cannot be one of the searched
+    assets. Other object types (textures, meshes, shaders, ...) are skipped
+    without being deserialized, and TextAssets only have their name peeked when
+    the installed UnityPy supports it instead of copying the whole m_Script.
+    obj may be an ObjectReader or a PPtr from env.container; a PPtr has no
+    peek_name, so it is dereferenced to its ObjectReader first.
     """
-    if not expected_filename:
-        return None
-    expected_file_path = Path(path_0000) / expected_filename[:2] / expected_filename
-    if expected_file_path.is_file():
-        try:
-            env = UnityPy.load(str(expected_file_path))
-        except Exception:
+    try:
+        if hasattr(type(obj), "deref"):
+            obj = obj.deref()
+        type_name = obj.type.name
+        if type_name not in TARGET_TYPES:
             return None
-        for path, obj in env.container.items():
-            if is_correct_file(path, obj, search_term):
-                return {"path": str(expected_file_path), "size": os.path.getsize(expected_file_path), "container": path}
-    return None
-
-def size_search(path_0000: Path, search_term: str, expected_size: int) -> Optional[dict]:
-    files_list = []
-    for root, dirs, files in os.walk(path_0000):
-        for fn in files:
-            fp = Path(root) / fn
-            try:
-                files_list.append((abs(fp.stat().st_size - expected_size), fp))
-            except Exception:
-                continue
-    files_list.sort(key=lambda x: x[0])
-    for _, file_path in files_list:
+        if type_name == "TextAsset" and hasattr(obj, "peek_name"):
+            return obj.peek_name()
+        return getattr(obj.read(), "m_Name", "")
+    except Exception:
+        return None
+
+def is_correct_file(path, obj, search_term):
+    return _object_name(obj) == search_term
+
+def _build_size_index(path_0000) -> List[Tuple[int, str]]:
+    """
+    Sorted (size, path) list of every file under path_0000, from one walk.
+    Built once per AssetFinder session and never kept beyond it, so files
+    replaced in place between searches are never reported with an old size.
+    """
+    index = []
+    # DirEntry.stat() is free on Windows, where scandir returns it with the listing
+    for entry in _iter_file_entries(path_0000):
         try:
-            env = UnityPy.load(str(file_path))
-        except Exception:
+            index.append((entry.stat().st_size, entry.path))
+        except OSError:
             continue
-        for path, obj in env.container.items():
-            if is_correct_file(path, obj, search_term):
-                return {"path": str(file_path), "size": os.path.getsize(file_path), "container": path}
-    return None
+    index.sort()
+    return index
+
+def _nearest_first(size_index: List[Tuple[int, str]], expected_size: int):
+    """
+    Yield (size, path) entries of a sorted size index in order of increasing
+    distance to expected_size, starting from its bisect position.
+    """
+    hi = bisect.bisect_left(size_index, (expected_size, ""))
+    lo = hi - 1
+    while lo >= 0 or hi < len(size_index):
+        if hi >= len(size_index) or (lo >= 0 and expected_size - size_index[lo][0] <= size_index[hi][0] - expected_size):
+            yield size_index[lo]
+            lo -= 1
+        else:
+            yield size_index[hi]
+            hi += 1
+
+def _check_env_for_targets(env, wanted_names) -> List[Tuple[str, str]]:
+    """
+    Return (m_Name, container path) for each object of env whose m_Name is in
+    wanted_names; only the first container is reported per name. Stops walking
+    the container as soon as every wanted name has been seen.
+    """
+    found: List[Tuple[str, str]] = []
+    remaining = set(wanted_names)
+    for path, obj in env.container.items():
+        if not remaining:
+            break
+        m_name = _object_name(obj)
+        if m_name in remaining:
+            found.append((m_name, path))
+            remaining.discard(m_name)
+    return found
+
+def _prefix_rank(file_path: str, prefixes, first_chars) -> int:
+    """
+    0 if file_path sits in one of the expected 0000/<xx> folders, 1 if its
+    folder shares the first hex digit with one of them, 2 otherwise.
+    """
+    folder = os.path.basename(os.path.dirname(file_path))
+    if folder in prefixes:
+        return 0
+    return 1 if folder[:1] in first_chars else 2
 
-def brute_force_search(path_0000: Path, search_term: str) -> Optional[dict]:
-    for root, dirs, files in os.walk(path_0000):
-        for fn in files:
-            fp = Path(root) / fn
+def _order_candidates(files: List[Tuple[str, int]], expected_sizes: List[int],
+                      expected_filenames: Iterable[str] = ()) -> List[Tuple[str, int]]:
+    """
+    Size prefilter for the brute force pass. Drops files below MIN_ASSET_SIZE and,
+    when every wanted term has an expected size, moves files within
+    max(4096 bytes, 10%) of one of those sizes to the front, nearest first, so
+    the scan can stop early. The remaining files follow in case the configured
+    sizes are stale. Files in the 0000/<xx> folders of the expected filenames
+    (then folders with the same first digit) go first among equally ranked ones.
+    """
+    files = [(fp, size) for fp, size in files if size >= MIN_ASSET_SIZE]
+    prefixes = {name[:2] for name in expected_filenames if name}
+    first_chars = {prefix[:1] for prefix in prefixes}
+    rank = (lambda fp: _prefix_rank(fp, prefixes, first_chars)) if prefixes else (lambda fp: 0)
+    if not expected_sizes or not all(expected_sizes):
+        if prefixes:
+            files.sort(key=lambda t: rank(t[0]))
+        return files
+    near, far = [], []
+    for fp, size in files:
+        if any(abs(size - e) <= max(4096, e // 10) for e in expected_sizes):
+            near.append((min(abs(size - e) for e in expected_sizes), rank(fp), fp, size))
+        else:
+            far.append((rank(fp), fp, size))
+    near.sort(key=lambda t: t[:2])
+    far.sort(key=lambda t: t[0])
+    return [(fp, size) for _, _, fp, size in near] + [(fp, size) for _, fp, size in far]
+
+def _prefetched(files: List[Tuple[str, int]]):
+    """
+    Yield the (path, size) entries of files while a background thread reads the
+    head of the next PREFETCH_DEPTH files, so disk reads overlap with UnityPy
+    parsing the current one. The thread only does I/O (which releases the GIL)
+    and stops as soon as the caller stops iterating.
+    """
+    ahead: "queue.Queue[Optional[Tuple[str, int]]]" = queue.Queue(maxsize=PREFETCH_DEPTH)
+    stop = threading.Event()
+
+    def warm():
+        for item in files:
+            if stop.is_set():
+                break
             try:
-                env = UnityPy.load(str(fp))
-            except Exception:
-                continue
-            for path, obj in env.container.items():
-                if is_correct_file(path, obj, search_term):
-                    return {"path": str(fp), "size": os.path.getsize(fp), "container": path}
-    return None
-
-def search(path_0000: Path, search_term: str, expected_filename: str, expected_size: int, logger=print):
-    """
-    Try named_search (direct path), then size_search, then brute force.
-    """
-    logger(f"Searching for {search_term} ...")
-    if expected_filename:
-        res = named_search(path_0000, search_term, expected_filename)
-        if res:
-            logger(f"Found {search_term} by named_search -> {res['path']}")
-            return res
-    # try size-based search if expected_size provided and > 0
-    if expected_size:
-        res = size_search(path_0000, search_term, expected_size)
-        if res:
-            logger(f"Found {search_term} by size_search -> {res['path']}")
-            return res
-    logger(f"Falling back to brute force for {search_term}...")
-    res = brute_force_search(path_0000, search_term)
-    if res:
-        logger(f"Found {search_term} by brute_force -> {res['path']}")
-    else:
-        logger(f"Could not find {search_term}.")
-    return res
+                with open(item[0], "rb") as f:
+                    f.read(PREFETCH_BYTES)
+            except OSError:
+                pass
+            ahead.put(item)
+        ahead.put(None)
+
+    thread = threading.Thread(target=warm, name="asset-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = ahead.get()
+            if item is None:
+                return
+            yield item
+    finally:
+        stop.set()
+        # unblock a producer waiting on the full queue so it can see stop
+        while thread.is_alive():
+            try:
+                ahead.get(timeout=0.05)
+            except queue.Empty:
+                pass
+
+# files scanned by this (worker) process, see _scan_file
+_scanned = 0
+
+def _scan_file(args) -> List[Tuple[str, str]]:
+    """
+    Process pool worker for the brute force pass: load one file and report the
+    wanted names it contains. The env is dropped before returning and the
+    worker collects every GC_EVERY files, so a long-lived worker does not pile
+    up parsed files.
+    """
+    global _scanned
+    file_path, wanted_names = args
+    env = _load_env(file_path)
+    hits = _check_env_for_targets(env, wanted_names) if env is not None else []
+    del env
+    _scanned += 1
+    if _scanned % GC_EVERY == 0:
+        gc.collect()
+    return hits
+
+# "<search_term> <expected_filename> [<expected_size>]", ### lines are comments
+_CFG_LINE = re.compile(r"^\s*(?!###)(\S+)\s+(\S+)(?:\s+(\d+))?")
+
+# config path -> (mtime_ns, triples); the file is only re-parsed after it changes
+_cfg_cache: Dict[str, Tuple[int, List[Tuple[str, str, int]]]] = {}
 
 def load_search_triples_from_config(config_path: Path) -> List[Tuple[str,str,int]]:
     """
@@ -119,69 +288,272 @@ def load_search_triples_from_config(config_path: Path) -> List[Tuple[str,str,int
     Returns list of triples (search_term, expected_filename, expected_size)
     """
     config_path = Path(config_path)
-    lines = []
+    key = str(config_path)
+    mtime = config_path.stat().st_mtime_ns
+    cached = _cfg_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return list(cached[1])
+    triples = []
+    seen_path = False
     with open(config_path, encoding="utf-8") as f:
-        for raw in f.readlines():
-            s = raw.strip()
-            if not s or s.startswith("###"):
+        for raw in f:
+            if not seen_path:
+                # first non-blank, non-comment line is the 0000 folder
+                s = raw.strip()
+                seen_path = bool(s) and not s.startswith("###")
                 continue
-            lines.append(s)
-    if not lines:
-        return []
-    triples = []
-    for line in lines[1:]:
-        parts = line.split()
-        if len(parts) >= 2:
-            search_term = parts[0]
-            expected_filename = parts[1]
-            expected_size = 0
-            if len(parts) >= 3:
-                try:
-                    expected_size = int(parts[2])
-                except Exception:
-                    expected_size = 0
-            triples.append((search_term, expected_filename, expected_size))
-    return triples
+            m = _CFG_LINE.match(raw)
+            if m:
+                search_term, expected_filename, expected_size = m.groups()
+                triples.append((search_term, expected_filename, int(expected_size) if expected_size else 0))
+    _cfg_cache[key] = (mtime, triples)
+    return list(triples)
 
-def multi_search(path_0000: Path, search_terms: List[str], expected_info: Optional[List[Tuple[str,int]]] = None, logger=print):
+def _expected_info_from_config(search_terms: List[str]) -> List[Tuple[str, int]]:
+    """
+    (expected_filename, expected_size) per term from step_1_config.txt at the
+    repo root, or DEFAULT_SEARCH_TRIPLES when there is no usable config.
     """
-    Multi-search helper. Uses the following priority to determine expected filename:
-    1) explicit expected_info argument (if provided by caller)
-    2) step_1_config.txt located at repo root
-    3) DEFAULT_SEARCH_TRIPLES hard-coded mapping (fast path based on your data)
-    4) fallback to empty expected filename (slow)
+    try:
+        if _CFG_PATH.is_file():
+            cfg_triples = load_search_triples_from_config(_CFG_PATH)
+        else:
+            cfg_triples = []
+    except Exception:
+        cfg_triples = []
 
-    Returns list of result dicts (or None) in the same order as search_terms.
+    # build mapping from cfg_triples or default triples
+    mapping = {t[0]: (t[1], t[2]) for t in cfg_triples} if cfg_triples else {t[0]: (t[1], t[2]) for t in DEFAULT_SEARCH_TRIPLES}
+    return [mapping.get(term, ("", 0)) for term in search_terms]
+
+class AssetFinder:
+    """
+    Search session. Every lookup phase (named, size, brute force) goes through
+    one instance so they share its UnityPy env cache and the size index of the
+    0000 folder; the module-level functions below are thin wrappers around a
+    short-lived instance. The caches live until close() (or the end of a
+    with block), so one finder can serve several searches.
     """
-    path_0000 = Path(path_0000)
+    def __init__(self, logger=print, env_cache: Optional[Dict[str, object]] = None):
+        self.logger = logger
+        self._env_cache: Dict[str, object] = {} if env_cache is None else env_cache
+        # path_0000 -> sorted (size, path) list, looked up once per session
+        self._size_indexes: Dict[str, List[Tuple[int, str]]] = {}
+
+    def close(self):
+        """Drop parsed envs and size indexes once the session is over."""
+        self._env_cache.clear()
+        self._size_indexes.clear()
+
+    def __enter__(self):
+        return self
 
-    if expected_info is None:
-        # attempt to load config near repo root
+    def __exit__(self, *exc):
+        self.close()
+
+    def _size_index(self, path_0000) -> List[Tuple[int, str]]:
+        key = os.fspath(path_0000)
+        index = self._size_indexes.get(key)
+        if index is None:
+            index = self._size_indexes[key] = _build_size_index(key)
+        return index
+
+    def named_search(self, path_0000, search_term: str, expected_filename: str) -> Optional[dict]:
+        """
+        Direct lookup to 0000/<first2>/<expected_filename> which is much faster than scanning.
+        """
+        if not expected_filename:
+            return None
+        # Master Duel always lays assets out as 0000/<xx>/<hexid>: one stat of that
+        # exact path decides the lookup, no directory listing needed
+        expected_file_path = os.path.join(path_0000, expected_filename[:2], expected_filename)
         try:
-            repo_root = Path(__file__).resolve().parents[1]
-            cfg_path = repo_root / "step_1_config.txt"
-            if cfg_path.is_file():
-                cfg_triples = load_search_triples_from_config(cfg_path)
-            else:
-                cfg_triples = []
-        except Exception:
-            cfg_triples = []
+            st = os.stat(expected_file_path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        env = _load_env(expected_file_path, self._env_cache)
+        if env is None:
+            return None
+        for path, obj in env.container.items():
+            if is_correct_file(path, obj, search_term):
+                return {"path": expected_file_path, "size": st.st_size, "container": path}
+        return None
+
+    def size_search(self, path_0000, search_term: str, expected_size: int) -> Optional[dict]:
+        for size, file_path in _nearest_first(self._size_index(path_0000), expected_size):
+            env = _load_env(file_path, self._env_cache)
+            if env is None:
+                continue
+            for path, obj in env.container.items():
+                if is_correct_file(path, obj, search_term):
+                    return {"path": file_path, "size": size, "container": path}
+        return None
+
+    def brute_force_search_many(self, path_0000, search_terms: List[str], jobs: Optional[int] = None,
+                                expected_sizes: Optional[Dict[str, int]] = None,
+                                expected_filenames: Optional[Dict[str, str]] = None) -> Dict[str, dict]:
+        """
+        Single walk over path_0000 that looks for all search_terms at once, so several
+        missing terms cost one pass over the folder instead of one pass each.
+        expected_sizes ({search_term: size}, 0 if unknown) and expected_filenames
+        ({search_term: hex name}) only change the order in which files are parsed. Large folders are scanned by `jobs` worker
+        processes (default: cpu count).
+        Returns {search_term: result dict} for the terms that were found.
+        """
+        wanted = set(search_terms)
+        found = {}
+        if not wanted:
+            return found
+        files = _order_candidates([(fp, size) for size, fp in self._size_index(path_0000)],
+                                  [(expected_sizes or {}).get(term, 0) for term in wanted],
+                                  [(expected_filenames or {}).get(term, "") for term in wanted])
+        jobs = jobs or os.cpu_count() or 1
+
+        if jobs > 1 and len(files) >= PARALLEL_MIN_FILES:
+            names = frozenset(wanted)
+            ex = ProcessPoolExecutor(max_workers=jobs)
+            try:
+                hits_per_file = ex.map(_scan_file, [(fp, names) for fp, _ in files], chunksize=32)
+                for (fp, size), hits in zip(files, hits_per_file):
+                    for m_name, path in hits:
+                        if m_name in wanted:
+                            found[m_name] = {"path": fp, "size": size, "container": path}
+                            wanted.discard(m_name)
+                    if not wanted:
+                        break
+            finally:
+                # drop the not yet started chunks once everything has been found
+                ex.shutdown(wait=True, cancel_futures=True)
+            return found
+
+        for n, (fp, size) in enumerate(_prefetched(files), 1):
+            # reuse envs parsed by the earlier phases, but do not cache new ones:
+            # the pass visits each file once, and cached envs would stay alive
+            # (file bytes plus parsed trees) until the session ends
+            env = self._env_cache[fp] if fp in self._env_cache else _load_env(fp)
+            if env is not None:
+                for m_name, path in _check_env_for_targets(env, wanted):
+                    found[m_name] = {"path": fp, "size": size, "container": path}
+                    wanted.discard(m_name)
+            del env
+            if not wanted:
+                break
+            if n % GC_EVERY == 0:
+                # parsed envs are reference cycles; collect them before they pile up
+                gc.collect()
+        return found
+
+    def brute_force_search(self, path_0000, search_term: str, expected_size: int = 0) -> Optional[dict]:
+        return self.brute_force_search_many(path_0000, [search_term],
+                                            expected_sizes={search_term: expected_size}).get(search_term)
+
+    def _direct_search(self, path_0000, search_term: str, expected_filename: str, expected_size: int) -> Optional[dict]:
+        """
+        The cheap phases of search(): named_search (direct path), then size_search.
+        """
+        self.logger(f"Searching for {search_term} ...")
+        if expected_filename:
+            res = self.named_search(path_0000, search_term, expected_filename)
+            if res:
+                self.logger(f"Found {search_term} by named_search -> {res['path']}")
+                return res
+        # try size-based search if expected_size provided and > 0
+        if expected_size:
+            res = self.size_search(path_0000, search_term, expected_size)
+            if res:
+                self.logger(f"Found {search_term} by size_search -> {res['path']}")
+                return res
+        return None
 
-        # build mapping from cfg_triples or default triples
-        mapping = {t[0]: (t[1], t[2]) for t in cfg_triples} if cfg_triples else {t[0]: (t[1], t[2]) for t in DEFAULT_SEARCH_TRIPLES}
-        expected_info = []
-        for term in search_terms:
-            if term in mapping:
-                expected_info.append(mapping[term])
-            else:
-                expected_info.append(("", 0))
-
-    ans = [None for _ in search_terms]
-    for i, term in enumerate(search_terms):
-        expected_filename, expected_size = ("", 0)
-        if expected_info and i < len(expected_info):
-            expected_filename, expected_size = expected_info[i]
-        ans[i] = search(path_0000, term, expected_filename, expected_size, logger=logger)
-    for file_path in ans:
-        logger(f"Search result: {file_path}")
-    return ans
+    def search(self, path_0000, search_term: str, expected_filename: str, expected_size: int) -> Optional[dict]:
+        """
+        Try named_search (direct path), then size_search, then brute force.
+        """
+        return self.search_all(path_0000, [search_term], [(expected_filename, expected_size)])[0]
+
+    def search_all(self, path_0000, search_terms: List[str], expected_info: List[Tuple[str, int]]) -> List[Optional[dict]]:
+        """
+        search() for several terms: direct phases per term, then at most one shared
+        brute force pass for every term that is still missing.
+        """
+        path_0000 = os.fspath(path_0000)
+        ans = [None for _ in search_terms]
+        for i, term in enumerate(search_terms):
+            expected_filename, expected_size = ("", 0)
+            if expected_info and i < len(expected_info):
+                expected_filename, expected_size = expected_info[i]
+            ans[i] = self._direct_search(path_0000, term, expected_filename, expected_size)
+        missing = list(dict.fromkeys(term for term, res in zip(search_terms, ans) if res is None))
+        if missing:
+            self.logger(f"Falling back to brute force for {', '.join(missing)}...")
+            expected_sizes = {term: info[1] for term, info in zip(search_terms, expected_info or [])}
+            expected_filenames = {term: info[0] for term, info in zip(search_terms, expected_info or [])}
+            found = self.brute_force_search_many(path_0000, missing, expected_sizes=expected_sizes,
+                                                 expected_filenames=expected_filenames)
+            for i, term in enumerate(search_terms):
+                if ans[i] is not None:
+                    continue
+                ans[i] = found.get(term)
+                if ans[i]:
+                    self.logger(f"Found {term} by brute_force -> {ans[i]['path']}")
+                else:
+                    self.logger(f"Could not find {term}.")
+        return ans
+
+    def multi_search(self, path_0000, search_terms: List[str], expected_info: Optional[List[Tuple[str, int]]] = None) -> List[Optional[dict]]:
+        """
+        Multi-search helper. Uses the following priority to determine expected filename:
+        1) explicit expected_info argument (if provided by caller)
+        2) step_1_config.txt located at repo root
+        3) DEFAULT_SEARCH_TRIPLES hard-coded mapping (fast path based on your data)
+        4) fallback to empty expected filename (slow)
+
+        Returns list of result dicts (or None) in the same order as search_terms.
+        """
+        if expected_info is None:
+            expected_info = _expected_info_from_config(search_terms)
+        ans = self.search_all(path_0000, search_terms, expected_info)
+        for file_path in ans:
+            self.logger(f"Search result: {file_path}")
+        return ans
+
+    def find_many(self, path_0000, targets: List[Tuple[str, str]]) -> List[Optional[dict]]:
+        """
+        targets is a list of (search_term, expected_filename) pairs.
+        Returns list of result dicts (or None) in the same order as targets.
+        """
+        # term -> hexid, built once; a term listed twice is only searched once
+        name_to_id: Dict[str, str] = {}
+        for term, hexid in targets:
+            name_to_id.setdefault(term, hexid)
+        terms = list(name_to_id)
+        results = self.search_all(path_0000, terms, [(name_to_id[term], 0) for term in terms])
+        by_name = dict(zip(terms, results))
+        return [by_name[term] for term, _ in targets]
+
+# Function API, kept for callers that predate AssetFinder. Pass env_cache to
+# share parsed envs between calls.
+
+def named_search(path_0000: Path, search_term: str, expected_filename: str, env_cache: Optional[dict] = None) -> Optional[dict]:
+    return AssetFinder(env_cache=env_cache).named_search(path_0000, search_term, expected_filename)
+
+def size_search(path_0000: Path, search_term: str, expected_size: int, env_cache: Optional[dict] = None) -> Optional[dict]:
+    return AssetFinder(env_cache=env_cache).size_search(path_0000, search_term, expected_size)
+
+def brute_force_search_many(path_0000: Path, search_terms: List[str], env_cache: Optional[dict] = None, jobs: Optional[int] = None,
+                            expected_sizes: Optional[Dict[str, int]] = None,
+                            expected_filenames: Optional[Dict[str, str]] = None) -> Dict[str, dict]:
+    return AssetFinder(env_cache=env_cache).brute_force_search_many(path_0000, search_terms, jobs, expected_sizes,
+                                                                    expected_filenames)
+
+def brute_force_search(path_0000: Path, search_term: str, env_cache: Optional[dict] = None, expected_size: int = 0) -> Optional[dict]:
+    return AssetFinder(env_cache=env_cache).brute_force_search(path_0000, search_term, expected_size)
+
+def search(path_0000: Path, search_term: str, expected_filename: str, expected_size: int, logger=print, env_cache: Optional[dict] = None):
+    return AssetFinder(logger, env_cache).search(path_0000, search_term, expected_filename, expected_size)
+
+def multi_search(path_0000: Path, search_terms: List[str], expected_info: Optional[List[Tuple[str,int]]] = None, logger=print):
+    with AssetFinder(logger) as finder:
+        return finder.multi_search(path_0000, search_terms, expected_info)
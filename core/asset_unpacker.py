@@ -10,77 +10,187 @@ Outputs are placed into an output directory.
 from pathlib import Path
 import UnityPy
 import json
-from core.decryptor import try_decrypt_with_key, find_crypto_key_for_file, get_crypto_key_from_file
+from core.decryptor import try_decrypt_with_key, find_crypto_key_for_file, get_crypto_key_from_file, zlib_header_matches
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 
-def unpack_single_asset(asset_path: Path, output_folder: Path, logger=print):
+def _load_and_extract(asset_path, file_bytes: Optional[bytes] = None,
+                      names: Optional[FrozenSet[str]] = None) -> Tuple[List[Tuple[str, str, object]], List[str]]:
     """
-    Load a single Unity asset file and extract TextAsset and MonoBehaviour objects.
+    Load one Unity asset file (from file_bytes if the caller already read it) and
+    return its TextAsset / MonoBehaviour payloads as picklable
+    (kind, m_Name, payload) tuples plus the per-object errors, so it can run in
+    a worker process while the caller does the writing.
+    kind is "bytes" (payload: raw bytes) or "json" (payload: typetree dict).
+    If names is given, only objects with those m_Names are extracted.
     """
-    output_folder.mkdir(parents=True, exist_ok=True)
-    env = UnityPy.load(str(asset_path))
+    payloads = []
+    errors = []
+    env = UnityPy.load(file_bytes if file_bytes is not None else str(asset_path))
     for obj in env.objects:
         try:
             if obj.type.name == "TextAsset":
+                # skip unwanted TextAssets before their m_Script is deserialized
+                if names is not None and hasattr(obj, "peek_name") and obj.peek_name() not in names:
+                    continue
                 data = obj.read()
+                if names is not None and data.m_Name not in names:
+                    continue
                 # m_Script is usually a str
                 raw = data.m_Script
                 # When UnityPy returns str, encode with surrogateescape to preserve bytes
                 if isinstance(raw, str):
-                    out_path = output_folder / f"{data.m_Name}.bytes"
-                    with open(out_path, "wb") as f:
-                        f.write(raw.encode("utf-8", "surrogateescape"))
+                    payloads.append(("bytes", data.m_Name, raw.encode("utf-8", "surrogateescape")))
                 else:
-                    out_path = output_folder / f"{data.m_Name}.bytes"
-                    with open(out_path, "wb") as f:
-                        f.write(bytes(raw))
+                    payloads.append(("bytes", data.m_Name, bytes(raw)))
             elif obj.type.name == "MonoBehaviour":
                 # write typetree json if available
                 if not obj.serialized_type.node:
                     continue
                 tree = obj.read_typetree()
-                out_path = output_folder / f"{tree['m_Name']}.json"
-                with open(out_path, "w", encoding="utf-8") as f:
-                    json.dump(tree, f, ensure_ascii=False, indent=2)
+                if names is not None and tree['m_Name'] not in names:
+                    continue
+                payloads.append(("json", tree['m_Name'], tree))
+        except Exception as e:
+            errors.append(f"Skipping object {obj} due to error: {e}")
+    return payloads, errors
+
+def _write_payloads(payloads, output_folder: Path, written: Dict[Path, bytes]):
+    """
+    Write payloads to output_folder; every .bytes file is also recorded in
+    written (path -> content) for the decryption pass.
+    """
+    for kind, name, payload in payloads:
+        if kind == "bytes":
+            out_path = output_folder / f"{name}.bytes"
+            with open(out_path, "wb") as f:
+                f.write(payload)
+            written[out_path] = payload
+        else:
+            with open(output_folder / f"{name}.json", "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+
+def unpack_single_asset(asset_path: Path, output_folder: Path, logger=print):
+    """
+    Load a single Unity asset file and extract TextAsset and MonoBehaviour objects.
+    """
+    output_folder.mkdir(parents=True, exist_ok=True)
+    payloads, errors = _load_and_extract(asset_path)
+    for msg in errors:
+        logger(msg)
+    written = {}
+    _write_payloads(payloads, output_folder, written)
+    _decrypt_extracted(output_folder, written, logger)
+
+def unpack_assets(asset_paths, output_folder: Path, logger=print, jobs: Optional[int] = None, progress_callback=None,
+                  names: Optional[Iterable[str]] = None):
+    """
+    unpack_single_asset() for several asset files. UnityPy parsing is CPU bound,
+    so the files are loaded by up to `jobs` worker processes (default: one per
+    file, capped at the cpu count); payloads are written here, in completion
+    order, and the decryption pass runs once at the end.
+    progress_callback(done, total) is called after each file. names, if given,
+    restricts extraction to objects with those m_Names.
+    Returns the list of paths that failed to load.
+    """
+    output_folder.mkdir(parents=True, exist_ok=True)
+    asset_paths = list(asset_paths)
+    total = len(asset_paths)
+    jobs = min(jobs or os.cpu_count() or 1, total)
+    names = frozenset(names) if names is not None else None
+    failed = []
+    written = {}
+
+    def handle(asset_path, result, done):
+        try:
+            payloads, errors = result()
+            for msg in errors:
+                logger(msg)
+            _write_payloads(payloads, output_folder, written)
         except Exception as e:
-            logger(f"Skipping object {obj} due to error: {e}")
+            logger(f"Error extracting {asset_path}: {e}")
+            failed.append(asset_path)
+        if progress_callback:
+            progress_callback(done, total)
+
+    if jobs <= 1:
+        # a reader thread loads the next file while the current one is parsed
+        with ThreadPoolExecutor(max_workers=1) as reader:
+            pending = reader.submit(Path(asset_paths[0]).read_bytes) if asset_paths else None
+            for done, asset_path in enumerate(asset_paths, start=1):
+                current = pending
+                pending = reader.submit(Path(asset_paths[done]).read_bytes) if done < total else None
+                handle(asset_path, lambda: _load_and_extract(asset_path, current.result(), names), done)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            futures = {ex.submit(_load_and_extract, asset_path, None, names): asset_path for asset_path in asset_paths}
+            for done, fut in enumerate(as_completed(futures), start=1):
+                handle(futures[fut], fut.result, done)
+
+    _decrypt_extracted(output_folder, written, logger)
+    return failed
 
-    # After extracting TextAsset/MonoBehaviour raw files, try to decrypt any .bytes that are compressed/encrypted:
-    for p in output_folder.glob("*.bytes"):
-        with open(p, "rb") as f:
-            raw = f.read()
-        # First try decompress directly (maybe it is compressed only)
+def _decode_one(p: Path, raw: bytes, key: Optional[int]) -> Optional[str]:
+    """
+    Try key 0, then key, on one extracted .bytes file and write <name>.bytes.dec
+    on success. Returns the log message, or None if neither key works.
+    """
+    # First try key 0 (maybe it is compressed only); the two-byte header check
+    # skips the full XOR + decompress for files that cannot match
+    if zlib_header_matches(raw, 0):
         try:
             dec = try_decrypt_with_key(raw, 0)
             # If key==0 works, save .bytes.dec
             out = p.with_suffix(p.suffix + ".dec")
             out.write_bytes(dec)
-            logger(f"Wrote decompressed {out.name}")
-            continue
+            return f"Wrote decompressed {out.name}"
         except Exception:
             pass
-        # Next, if there's a crypto key file in the same folder (unlikely here), try it
-        key = get_crypto_key_from_file(output_folder)
-        if key is not None:
-            try:
-                dec = try_decrypt_with_key(raw, key)
-                out = p.with_suffix(p.suffix + ".dec")
-                out.write_bytes(dec)
-                logger(f"Wrote decrypted {out.name} with key {hex(key)}")
-                continue
-            except Exception:
-                pass
+    # Next, try the known key
+    if key is not None and zlib_header_matches(raw, key):
+        try:
+            dec = try_decrypt_with_key(raw, key)
+            out = p.with_suffix(p.suffix + ".dec")
+            out.write_bytes(dec)
+            return f"Wrote decrypted {out.name} with key {hex(key)}"
+        except Exception:
+            pass
+    return None
+
+def _decrypt_extracted(output_folder: Path, written: Dict[Path, bytes], logger=print):
+    """
+    After extracting TextAsset/MonoBehaviour raw files, try to decrypt the .bytes that are compressed/encrypted.
+    written maps the .bytes files of this unpack to their content, so nothing is read back from disk.
+    """
+    # crypto key file in the same folder (unlikely here), read once per pass;
+    # a brute-forced key replaces it for the remaining files
+    key = get_crypto_key_from_file(output_folder)
+    items = list(written.items())
+    # the files are independent, so the known-key attempts run on a thread
+    # pool; only the zlib half of each job releases the GIL (the XOR holds it),
+    # so the overlap is partial. Brute force below stays serial since it
+    # updates the key and the key file
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(items)))) as ex:
+        results = list(ex.map(lambda item: _decode_one(item[0], item[1], key), items))
+    tried_key = key
+    for (p, raw), msg in zip(items, results):
+        if msg is None and key != tried_key:
+            # a key brute-forced for an earlier file
+            msg = _decode_one(p, raw, key)
+        if msg is not None:
+            logger(msg)
+            continue
         # Last resort: try to find key by brute force for this file (may be slow)
         # We will only attempt for CARD_Indx and related large files
         if p.name.startswith("CARD_Indx") or p.name.startswith("CARD_Desc") or p.name.startswith("CARD_Name"):
             try:
-                key = find_crypto_key_for_file(p)
-                if key is not None:
+                found = find_crypto_key_for_file(p)
+                if found is not None:
+                    key = found
                     dec = try_decrypt_with_key(raw, key)
                     out = p.with_suffix(p.suffix + ".dec")
                     out.write_bytes(dec)
                     logger(f"Brute-forced key {hex(key)} and wrote {out.name}")
             except Exception as e:
                 logger(f"Failed to brute-force {p.name}: {e}")
-
-    return
\ No newline at end of file
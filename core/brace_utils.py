@@ -1,3 +1,4 @@
+from collections import Counter
 from typing import List, Tuple
 
 def string_insert(orig: bytes, ins: bytes, index: int) -> bytes:
@@ -8,21 +9,19 @@ def insert_braces(effect_text: str, parts_arr: List[Tuple[int,int]]) -> str:
     if not parts_arr:
         return effect_text
     ans = effect_text.encode('utf-8')
-    insertion_dict = {}
-    for (a, b) in parts_arr:
-        left_index = a
-        right_index = b + 1
-        if left_index not in insertion_dict:
-            insertion_dict[left_index] = {'L': 0, 'R': 0}
-        if right_index not in insertion_dict:
-            insertion_dict[right_index] = {'L': 0, 'R': 0}
-        insertion_dict[left_index]['L'] += 1
-        insertion_dict[right_index]['R'] += 1
-    for index in sorted(insertion_dict.keys(), reverse=True):
-        ins = b''
-        ins += b'}' * insertion_dict[index]['R']
-        ins += b'{' * insertion_dict[index]['L']
-        ans = string_insert(ans, ins, index)
+    # '{' count at each left edge, '}' count just past each right edge
+    L_at = Counter(a for a, _ in parts_arr)
+    R_at = Counter(b + 1 for _, b in parts_arr)
+    # one forward pass: copy the text between insertion points once instead of
+    # re-copying the whole buffer for every insertion
+    parts = []
+    last = 0
+    for index in sorted(L_at.keys() | R_at.keys()):
+        parts.append(ans[last:index])
+        parts.append(b'}' * R_at[index] + b'{' * L_at[index])
+        last = index
+    parts.append(ans[last:])
+    ans = b''.join(parts)
     try:
         return ans.decode('utf-8')
     except Exception:
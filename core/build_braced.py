@@ -1,8 +1,8 @@
 from pathlib import Path
-import json
 from typing import Tuple
-from core.part_parser import get_pidx_table, get_part_table
+from core.part_parser import load_part_table
 from core.brace_utils import insert_braces
+from core.utils import dumps_json, loads_json
 
 def build_braced(extracted_folder: str) -> Tuple[bool, str]:
     ef = Path(extracted_folder)
@@ -24,7 +24,7 @@ def build_braced(extracted_folder: str) -> Tuple[bool, str]:
 
     try:
         if desc_json.exists():
-            descs = json.loads(desc_json.read_text(encoding="utf-8"))
+            descs = loads_json(desc_json.read_bytes())
         else:
             raw = desc_dec.read_bytes().decode("utf-8", errors="replace")
             descs = [s for s in raw.split("\x00\x00") if s]
@@ -32,22 +32,31 @@ def build_braced(extracted_folder: str) -> Tuple[bool, str]:
         return False, f"Failed to read descriptions: {e}"
 
     try:
-        pidx_table = get_pidx_table(pidx_dec)
-        part_table = get_part_table(part_dec, pidx_table)
+        part_table = load_part_table(pidx_dec, part_dec)
     except Exception as e:
         return False, f"Failed to build part/pidx tables: {e}"
 
-    braced = []
-    for i, desc in enumerate(descs):
-        parts = part_table[i] if i < len(part_table) else []
-        try:
-            braced_desc = insert_braces(desc, parts)
-        except Exception:
-            braced_desc = desc
-        braced.append(braced_desc)
+    def braced():
+        for i, desc in enumerate(descs):
+            parts = part_table[i] if i < len(part_table) else []
+            if not parts:
+                yield desc
+                continue
+            try:
+                yield insert_braces(desc, parts)
+            except Exception:
+                yield desc
 
+    # stream the array entry by entry (same layout as an indent=2 dump) so
+    # neither the braced list nor the whole JSON text is held in memory
     try:
-        out_path.write_text(json.dumps(braced, ensure_ascii=False, indent=2), encoding="utf-8")
+        with open(out_path, "wb", buffering=1 << 20) as f:
+            sep = b"[\n  "
+            for braced_desc in braced():
+                f.write(sep)
+                f.write(dumps_json(braced_desc))
+                sep = b",\n  "
+            f.write(b"[]" if sep == b"[\n  " else b"\n]")
     except Exception as e:
         return False, f"Failed to write braced JSON: {e}"
 
@@ -9,7 +9,6 @@ Example:
 """
 import sys
 from pathlib import Path
-import json
 
 def main(p):
     ef = Path(p)
@@ -29,7 +28,8 @@ def main(p):
 
     if braced.exists():
         try:
-            b = json.loads(braced.read_text(encoding="utf-8"))
+            from core.utils import loads_json
+            b = loads_json(braced.read_bytes())
             print("Braced entries:", len(b))
             print("Sample braced[0]:")
             print(b[0][:400])
@@ -8,30 +8,76 @@ around `find_crypto_key_for_file`/`find_key_for_encrypted_bytes`.
 Functions:
 - decrypt_bytes(data: bytes, key: int) -> bytes
 - try_decrypt_with_key(data: bytes, key: int) -> bytes
+- zlib_header_matches(data: bytes, key: int) -> bool
 - encrypt_bytes(plaintext: bytes, key: int) -> bytes
-- find_key_for_encrypted_bytes(data: bytes, start_key: int = 0) -> int
+- find_key_for_encrypted_bytes(data: bytes, start_key: int = 0, max_trials: Optional[int] = None) -> int
 - find_crypto_key_for_file(path: Path) -> int
 - get_crypto_key_from_file(folder: Path) -> Optional[int]
 """
-from typing import Optional
+from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from itertools import cycle
 from pathlib import Path
+import mmap
 import zlib
 
-def _xor_transform(buf: bytearray, key: int):
-    # same algorithm used by community scripts
-    for i in range(len(buf)):
-        v = i + key + 0x23D
-        v *= key
-        v ^= i % 7
-        buf[i] ^= v & 0xFF
+# Keystream byte i is ((i + key + 0x23D) * key ^ (i % 7)) & 0xFF (same algorithm
+# used by community scripts). The low byte of the product only depends on
+# i mod 256 and key mod 256, so the stream repeats every lcm(256, 7) = 1792
+# bytes and there are only 256 distinct streams.
+_KEYSTREAM_PERIOD = 256 * 7
+_KEYSTREAM_KEYS = 256
+
+@lru_cache(maxsize=_KEYSTREAM_KEYS)
+def _keystream_period(key: int) -> bytes:
+    # one period per key mod 256, so the cache covers every possible key.
+    # (i + key + 0x23D) * key grows by key with each byte, so its low byte is
+    # kept as a running sum instead of multiplying; only the i % 7 term cycles.
+    stream = bytearray(_KEYSTREAM_PERIOD)
+    acc = ((key + 0x23D) * key) & 0xFF
+    step = key & 0xFF
+    for i, m7 in zip(range(_KEYSTREAM_PERIOD), cycle(range(7))):
+        stream[i] = acc ^ m7
+        acc = (acc + step) & 0xFF
+    return bytes(stream)
+
+def _keystream(key: int, n: int) -> bytes:
+    period = _keystream_period(key & 0xFF)
+    reps, rest = divmod(n, _KEYSTREAM_PERIOD)
+    return period * reps + period[:rest]
+
+def _xor_bytes(data, key: int) -> bytes:
+    """
+    data (any bytes-like object) XORed with the keystream of key, as new bytes.
+    The whole buffer is XORed with the tiled keystream in one go, as two big
+    ints, instead of a Python-level loop per byte. This trades memory for
+    speed: the data int, the keystream (bytes and int), the result int and the
+    output are each the size of data, so the peak is a few times len(data).
+    The big-int work holds the GIL.
+    """
+    n = len(data)
+    if not n:
+        return b""
+    return (int.from_bytes(data, "little") ^ int.from_bytes(_keystream(key, n), "little")).to_bytes(n, "little")
+
+def zlib_header_matches(data: bytes, key: int) -> bool:
+    """
+    Cheap test whether data decrypted with key can start a zlib stream: only the
+    first two bytes are decrypted and checked as a zlib header (deflate method,
+    window <= 32K, no preset dictionary, valid FCHECK). decrypt_bytes can only
+    succeed if this returns True.
+    """
+    if len(data) < 2:
+        return False
+    cmf = data[0] ^ ((((0 + key + 0x23D) * key) ^ 0) & 0xFF)
+    flg = data[1] ^ ((((1 + key + 0x23D) * key) ^ 1) & 0xFF)
+    return cmf & 0x0F == 8 and cmf >> 4 <= 7 and not flg & 0x20 and ((cmf << 8) | flg) % 31 == 0
 
 def decrypt_bytes(data: bytes, key: int) -> bytes:
     """
     Apply XOR transform with key then zlib.decompress. Raises zlib.error on failure.
     """
-    buf = bytearray(data)
-    _xor_transform(buf, key)
-    return zlib.decompress(buf)
+    return zlib.decompress(_xor_bytes(data, key))
 
 def try_decrypt_with_key(data: bytes, key: int) -> bytes:
     """
@@ -43,55 +89,66 @@ def encrypt_bytes(plaintext: bytes, key: int) -> bytes:
     """
     Compress then XOR-encrypt (inverse of decrypt_bytes).
     """
-    comp = zlib.compress(plaintext)
-    buf = bytearray(comp)
-    _xor_transform(buf, key)
-    return bytes(buf)
+    return _xor_bytes(zlib.compress(plaintext), key)
 
-def find_key_for_encrypted_bytes(data: bytes, start_key: int = 0) -> int:
+def find_key_for_encrypted_bytes(data: bytes, start_key: int = 0, max_trials: Optional[int] = None) -> int:
     """
     Brute-force search for a crypto key given raw encrypted bytes.
-    Returns the first integer key that produces valid zlib-decompressable output.
-    WARNING: can be slow depending on key value.
-    """
-    key = start_key
-    # loop until we find a key; leave it infinite to match community tools behaviour
-    while True:
-        try:
-            # If this doesn't raise, we found a valid key
-            _ = decrypt_bytes(data, key)
-            return key
-        except zlib.error:
-            key += 1
-            continue
-        except Exception:
-            # Some other error (rare); continue searching
-            key += 1
-            continue
+    Returns the first integer key >= start_key that produces valid zlib-decompressable
+    output. Keys whose first two decrypted bytes are not a zlib header are skipped
+    without decompressing. Raises ValueError if no key works (within max_trials keys).
+    """
+    # keys only matter mod 256, so 256 consecutive keys cover the whole key space:
+    # if none of them works no larger key will either. This bounds the search to a
+    # few hundred two-byte checks, cheaper than starting any worker processes.
+    trials = _KEYSTREAM_KEYS if max_trials is None else min(max_trials, _KEYSTREAM_KEYS)
+    for key in range(start_key, start_key + trials):
+        if zlib_header_matches(data, key):
+            try:
+                # If this doesn't raise, we found a valid key
+                _ = decrypt_bytes(data, key)
+                return key
+            except Exception:
+                # zlib.error past the header, or some other rare error; keep searching
+                pass
+    raise ValueError(f"no crypto key in [{start_key}, {start_key + trials})")
 
 def find_crypto_key_for_file(path: Path, start_key: int = 0) -> int:
     """
     Read file bytes and brute-force a key. Writes !CryptoKey.txt into same folder
     (hex format) and returns the discovered key.
     """
-    data = path.read_bytes()
-    key = find_key_for_encrypted_bytes(data, start_key=start_key)
+    # map the file instead of reading it: the header prefilter only touches the
+    # first two bytes per key and a full decrypt XORs straight from the mapping
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        key = find_key_for_encrypted_bytes(mm, start_key=start_key)
     try:
         ckfile = path.parent / "!CryptoKey.txt"
         ckfile.write_text(hex(key))
+        _key_file_cache[str(ckfile)] = (ckfile.stat().st_mtime_ns, key)
     except Exception:
         # best-effort; ignore write errors
         pass
     return key
 
+# !CryptoKey.txt path -> (mtime_ns, key); the file is only re-read after it changes
+_key_file_cache: Dict[str, Tuple[int, Optional[int]]] = {}
+
 def get_crypto_key_from_file(folder: Path) -> Optional[int]:
     """
     Read !CryptoKey.txt if present in folder, return int or None.
     """
     ck = Path(folder) / "!CryptoKey.txt"
-    if ck.exists():
-        try:
-            return int(ck.read_text().strip(), 16)
-        except Exception:
-            return None
-    return None
+    try:
+        mtime = ck.stat().st_mtime_ns
+    except OSError:
+        return None
+    cached = _key_file_cache.get(str(ck))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        key = int(ck.read_text().strip(), 16)
+    except Exception:
+        key = None
+    _key_file_cache[str(ck)] = (mtime, key)
+    return key
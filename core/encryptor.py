@@ -3,23 +3,18 @@ Merge + encrypt logic based on _CARD_merge+calc_index.py and _CARD_encrypt.py
 - Rebuild merged name/desc strings and index array
 - Write .bytes (encrypted) files using community crypto
 """
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from core.decryptor import encrypt_bytes, find_key_for_encrypted_bytes
-from core.utils import write_json
-import json
+from core.decryptor import encrypt_bytes, find_key_for_encrypted_bytes, get_crypto_key_from_file
+from core.utils import loads_json, write_json
+import shutil
+import struct
 
 class Encryptor:
     def __init__(self):
         self.keyfile = Path(__file__).parent / "!CryptoKey.txt"
-        self.key = None
-        if self.keyfile.exists():
-            try:
-                self.key = int(self.keyfile.read_text().strip(), 16)
-            except Exception:
-                self.key = None
-
-    def _get_utf8_len(self, s: str):
-        return len(s.encode('utf-8'))
+        # cached per keyfile mtime, so new Encryptors do not re-read it
+        self.key = get_crypto_key_from_file(self.keyfile.parent)
 
     def build_mod(self, extracted_folder: Path, changed_folder: Path, modded_folder: Path, logger=None, progress_callback=None):
         extracted = Path(extracted_folder)
@@ -31,41 +26,39 @@ class Encryptor:
         name_path = changed / "CARD_Name.bytes.dec.json" if (changed / "CARD_Name.bytes.dec.json").exists() else extracted / "CARD_Name.bytes.dec.json"
         desc_path = changed / "CARD_Desc.bytes.dec.json" if (changed / "CARD_Desc.bytes.dec.json").exists() else extracted / "CARD_Desc.bytes.dec.json"
 
-        with name_path.open(encoding="utf-8") as f:
-            names = json.load(f)
-        with desc_path.open(encoding="utf-8") as f:
-            descs = json.load(f)
+        names = loads_json(name_path.read_bytes())
+        descs = loads_json(desc_path.read_bytes())
 
-        # Merge with padding to 4 bytes like community script
-        name_merge = "\x00"*8
-        desc_merge = "\x00"*8
+        # Merge with padding to 4 bytes like community script; each sentence is
+        # utf-8 encoded once and appended to a growing buffer
+        name_merge = bytearray(8)
+        desc_merge = bytearray(8)
         name_indx = [0]
         desc_indx = [0]
+        # both buffers start with 8 zero bytes and stay 4-byte aligned, so each
+        # sentence's end offset (the first one counting the header) is just the
+        # buffer length after appending it and its padding
         for i in range(len(names)):
-            nm = names[i]
-            ds = descs[i]
-            def helper(sentence, indx, merge_str):
-                length = self._get_utf8_len(sentence)
-                if i == 0:
-                    length += 8
-                space_len = (4 - length % 4) % 4
-                indx.append(indx[-1] + length + space_len)
-                return merge_str + sentence + ("\x00"*space_len)
-            name_merge = helper(nm, name_indx, name_merge)
-            desc_merge = helper(ds, desc_indx, desc_merge)
+            data = names[i].encode("utf-8")
+            name_merge += data
+            name_merge += b"\x00" * (-len(data) & 3)
+            name_indx.append(len(name_merge))
+            data = descs[i].encode("utf-8")
+            desc_merge += data
+            desc_merge += b"\x00" * (-len(data) & 3)
+            desc_indx.append(len(desc_merge))
         name_indx = [4,8] + name_indx[1:]
         desc_indx = [4,8] + desc_indx[1:]
-        card_indx = []
-        for i in range(len(name_indx)):
-            card_indx.append(name_indx[i]); card_indx.append(desc_indx[i])
+        # interleave name/desc offsets with slice assignment
+        card_indx = [0] * (2 * len(name_indx))
+        card_indx[0::2] = name_indx
+        card_indx[1::2] = desc_indx
         # int -> 4 little endian bytes
-        def int_to_4bytes(n):
-            return bytes([(n >> (8*i)) & 0xFF for i in range(4)])
-        card_indx_merge = b"".join(int_to_4bytes(x) for x in card_indx)
+        card_indx_merge = struct.pack(f"<{len(card_indx)}I", *card_indx)
 
         # write dec files to modded folder first
-        (modded / "CARD_Name.bytes.dec").write_bytes(name_merge.encode("utf-8"))
-        (modded / "CARD_Desc.bytes.dec").write_bytes(desc_merge.encode("utf-8"))
+        (modded / "CARD_Name.bytes.dec").write_bytes(name_merge)
+        (modded / "CARD_Desc.bytes.dec").write_bytes(desc_merge)
         (modded / "CARD_Indx.bytes.dec").write_bytes(card_indx_merge)
 
         # determine key: prefer existing key; else try find key using extracted CARD_Indx.bytes (raw encrypted file)
@@ -74,7 +67,7 @@ class Encryptor:
             ext_indx_enc = extracted / "CARD_Indx.bytes"
             if ext_indx_enc.exists():
                 try:
-                    k = find_key_for_encrypted_bytes(ext_indx_enc.read_bytes(), start=0, max_trials=1<<14)
+                    k = find_key_for_encrypted_bytes(ext_indx_enc.read_bytes(), start_key=0, max_trials=1<<14)
                     self.key = k
                     if logger: logger.log(f"Detected crypto key {hex(k)}")
                     self.keyfile.write_text(hex(k))
@@ -83,26 +76,29 @@ class Encryptor:
             else:
                 self.key = 0
 
-        # encrypt .dec content to .bytes
-        for name in ["CARD_Name","CARD_Desc","CARD_Indx"]:
-            dec = (modded / f"{name}.bytes.dec").read_bytes()
-            enc = encrypt_bytes(dec, self.key)
-            (modded / f"{name}.bytes").write_bytes(enc)
-            if logger: logger.log(f"Wrote encrypted {name}.bytes")
-
-        # For other assets: copy over Card_Part, WORD_* from changed or extracted and encrypt if dec exists
+        # encrypt .dec content to .bytes; the merged CARD_* contents are still in
+        # memory, other assets come from changed or extracted if a .dec exists
+        jobs = [("CARD_Name", name_merge), ("CARD_Desc", desc_merge), ("CARD_Indx", card_indx_merge)]
         for other in ["Card_Part","WORD_Text","WORD_Indx"]:
             src = (changed / f"{other}.bytes.dec") if (changed / f"{other}.bytes.dec").exists() else (extracted / f"{other}.bytes.dec")
             if src and src.exists():
-                dec = src.read_bytes()
-                enc = encrypt_bytes(dec, self.key)
-                (modded / f"{other}.bytes").write_bytes(enc)
-                if logger: logger.log(f"Wrote encrypted {other}.bytes")
+                jobs.append((other, src.read_bytes()))
             else:
                 # fallback: copy original .bytes if present
                 orig = extracted / f"{other}.bytes"
                 if orig.exists():
-                    (modded / orig.name).write_bytes(orig.read_bytes())
+                    # plain copy at OS level (sendfile & co), never read into memory
+                    shutil.copyfile(orig, modded / orig.name)
+
+        # the files are independent, so they are encrypted on a thread pool and
+        # written as they finish; zlib.compress releases the GIL while the XOR
+        # step holds it, so only the compression overlaps
+        with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+            futures = {ex.submit(encrypt_bytes, dec, self.key): name for name, dec in jobs}
+            for fut in as_completed(futures):
+                name = futures[fut]
+                (modded / f"{name}.bytes").write_bytes(fut.result())
+                if logger: logger.log(f"Wrote encrypted {name}.bytes")
         if progress_callback:
             progress_callback(100)
         if logger:
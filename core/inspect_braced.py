@@ -16,7 +16,7 @@ This prints:
 """
 import sys
 from pathlib import Path
-import json
+from core.utils import loads_json
 
 def truncate(s, n=250):
     if s is None:
@@ -48,7 +48,7 @@ def main(argv):
     descs = []
     try:
         if braced_p.exists():
-            braced = json.loads(braced_p.read_text(encoding="utf-8"))
+            braced = loads_json(braced_p.read_bytes())
             print("Braced entries:", len(braced))
         else:
             print("No braced JSON found.")
@@ -57,7 +57,7 @@ def main(argv):
 
     try:
         if desc_json_p.exists():
-            descs = json.loads(desc_json_p.read_text(encoding="utf-8"))
+            descs = loads_json(desc_json_p.read_bytes())
             print("Desc json entries:", len(descs))
         else:
             print("No desc json found.")
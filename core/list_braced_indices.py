@@ -9,7 +9,7 @@ Prints first N indices with parts and sample braced text.
 """
 import sys
 from pathlib import Path
-import json
+from core.utils import loads_json
 
 def main(argv):
     if len(argv) < 2:
@@ -24,8 +24,8 @@ def main(argv):
         print("Required extracted files missing in", ef)
         return 2
 
-    braced = json.loads(braced_p.read_text(encoding="utf-8"))
-    descs = json.loads(desc_json_p.read_text(encoding="utf-8"))
+    braced = loads_json(braced_p.read_bytes())
+    descs = loads_json(desc_json_p.read_bytes())
 
     from core.part_parser import get_pidx_table, get_part_table
     pidx_table = get_pidx_table(pidx_p)
@@ -37,7 +37,8 @@ def main(argv):
     N = 30
     print(f"First {min(N, len(indices))} indices with parts:")
     for i in indices[:N]:
-        print(f"  {i}  parts={len(part_table[i])}  sample_braced_snippet='{braced[i][:120].replace(chr(10),'\\n')}'")
+        snippet = braced[i][:120].replace("\n", "\\n")
+        print(f"  {i}  parts={len(part_table[i])}  sample_braced_snippet='{snippet}'")
     if len(indices) > N:
         print(f"... more (total {len(indices)})")
     return 0
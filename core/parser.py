@@ -1,7 +1,34 @@
 from pathlib import Path
-from core.utils import write_json
-from typing import List
-import json
+from core.utils import loads_json, write_json, cache_path, read_cache, write_cache
+from typing import Iterable, List, Tuple
+import hashlib
+import mmap
+import os
+import struct
+
+_ESCAPE_QUOTES = str.maketrans({'"': '\\"'})
+
+def _source_key(paths: Iterable[Path]) -> bytes:
+    # size + mtime of every source file; any rewrite of one of them changes it
+    h = hashlib.blake2b(digest_size=16)
+    for p in paths:
+        st = p.stat()
+        h.update(st.st_size.to_bytes(8, "little"))
+        h.update(st.st_mtime_ns.to_bytes(8, "little"))
+    return h.digest()
+
+def _map_file(path: Path):
+    """
+    Read-only mmap of path, or b"" for an empty file (which cannot be mapped).
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, "MADV_WILLNEED"):
+        # ask the OS to start reading the pages in before the decode pass needs them
+        mm.madvise(mmap.MADV_WILLNEED)
+    return mm
 
 class CardModule:
     """
@@ -14,40 +41,40 @@ class CardModule:
         self.effect_counts: List[int] = []
         self.indx_bytes = b""
 
-    def _bytes_to_int_list(self, path: Path):
-        with path.open("rb") as f:
-            data = f.read()
-        return list(data)
-
-    def _progressive_processing(self, card_indx_path: Path, target_path: Path, start: int):
-        arr = self._bytes_to_int_list(card_indx_path)
-        idxs = []
+    def _read_offsets(self, indx_bytes: bytes, start: int) -> Tuple[int, ...]:
         # every 8 bytes block contains two 4-byte little-endian ints; start selects name(0) or desc(4)
-        for i in range(start, len(arr), 8):
-            chunk = bytes(arr[i:i+4])
-            if len(chunk) < 4:
-                break
-            num = int.from_bytes(chunk, 'little')
-            idxs.append(num)
-        # drop header index
-        if len(idxs) > 0:
-            idxs = idxs[1:]
-        data = target_path.read_bytes()
-        res = []
-        for i in range(len(idxs) - 1):
-            a = idxs[i]; b = idxs[i+1]
-            if a < 0 or b <= a or b > len(data):
-                # guard — keep alignment with empty string if indices look bad
-                res.append("")
-                continue
-            s = data[a:b]
+        ints = struct.unpack_from("<%dI" % (len(indx_bytes) // 4), indx_bytes)
+        # the stride-2 slice past the first pair also drops the header index
+        return ints[start // 4 + 2::2]
+
+    def _progressive_processing(self, indx_bytes: bytes, data, start: int):
+        # data is the target file's bytes or a read-only mmap of it
+        idxs = self._read_offsets(indx_bytes, start)
+        size = len(data)
+        # NUL padding is stripped on the bytes before decoding ("replace" gives the
+        # same text as a strict decode whenever that would succeed); an empty
+        # string keeps the alignment if indices look bad
+        with memoryview(data) as mv:
+            return [bytes(mv[a:b]).rstrip(b"\x00").decode("utf-8", errors="replace") if 0 <= a < b <= size else ""
+                    for a, b in zip(idxs, idxs[1:])]
+
+    def _load_braced(self, braced_j: Path):
+        # Load braced JSON if available. We want the GUI to show escaped quotes (\"Name\")
+        # while keeping the original (unescaped) braced strings for counting effects.
+        if braced_j.exists():
             try:
-                txt = s.decode("utf-8")
+                braced_raw = loads_json(braced_j.read_bytes())
+                # effect_counts must be computed from the real braced data (without added backslashes)
+                from core.brace_utils import count_top_level_braces
+                self.effect_counts = [count_top_level_braces(s) for s in braced_raw]
+                # create display-safe version where internal double-quotes are escaped
+                self.braced_descs = [s.translate(_ESCAPE_QUOTES) for s in braced_raw]
+                return
             except Exception:
-                txt = s.decode("utf-8", errors="replace")
-            txt = txt.rstrip("\x00")
-            res.append(txt)
-        return res
+                # fallback: if parsing fails, use descs and zero effects
+                pass
+        self.braced_descs = [d for d in self.descs]
+        self.effect_counts = [0 for _ in self.descs]
 
     def load_from_folder(self, extracted_folder: Path):
         ef = Path(extracted_folder)
@@ -60,57 +87,48 @@ class CardModule:
 
         # Support pre-split JSON case (sample)
         if jn.exists() and jd.exists() and (not (card_indx.exists() and card_name.exists() and card_desc.exists())):
-            self.names = json.loads(jn.read_text(encoding="utf-8"))
-            self.descs = json.loads(jd.read_text(encoding="utf-8"))
-
-            # Load braced JSON if available. We want the GUI to show escaped quotes (\"Name\")
-            # while keeping the original (unescaped) braced strings for counting effects.
-            if braced_j.exists():
-                try:
-                    braced_raw = json.loads(braced_j.read_text(encoding="utf-8"))
-                    # effect_counts must be computed from the real braced data (without added backslashes)
-                    from core.brace_utils import count_top_level_braces
-                    self.effect_counts = [count_top_level_braces(s) for s in braced_raw]
-                    # create display-safe version where internal double-quotes are escaped
-                    self.braced_descs = [s.replace('"', '\\"') for s in braced_raw]
-                except Exception:
-                    # fallback: if parsing fails, use descs and zero effects
-                    self.braced_descs = [d for d in self.descs]
-                    self.effect_counts = [0 for _ in self.descs]
-            else:
-                self.braced_descs = [d for d in self.descs]
-                self.effect_counts = [0 for _ in self.descs]
+            self.names = loads_json(jn.read_bytes())
+            self.descs = loads_json(jd.read_bytes())
+            self._load_braced(braced_j)
             return
 
         if not (card_indx.exists() and card_name.exists() and card_desc.exists()):
             raise FileNotFoundError("Missing CARD_Indx.bytes.dec or CARD_Name.bytes.dec or CARD_Desc.bytes.dec")
 
-        self.indx_bytes = card_indx.read_bytes()
-        self.names = self._progressive_processing(card_indx, card_name, 0)
-        self.descs = self._progressive_processing(card_indx, card_desc, 4)
+        # reuse the last parse while none of the three .dec files changed
+        cache = cache_path(ef, "cardmodule")
+        key = _source_key((card_indx, card_name, card_desc))
+        cached = read_cache(cache, key)
+        if cached is not None:
+            self.indx_bytes, self.names, self.descs = cached
+            if not (jn.exists() and jd.exists()):
+                write_json(self.names, jn)
+                write_json(self.descs, jd)
+            self._load_braced(braced_j)
+            return
+
+        # CARD_Indx is read once and shared by both passes; the name and desc
+        # files are mapped (their readahead starts right away, in parallel) and
+        # only the strings are copied out of them
+        name_map = _map_file(card_name)
+        desc_map = _map_file(card_desc)
+        try:
+            self.indx_bytes = card_indx.read_bytes()
+            self.names = self._progressive_processing(self.indx_bytes, name_map, 0)
+            self.descs = self._progressive_processing(self.indx_bytes, desc_map, 4)
+        finally:
+            for m in (name_map, desc_map):
+                if isinstance(m, mmap.mmap):
+                    m.close()
 
         # write canonical jsons (used by Encryptor)
-        write_json(str(ef / "CARD_Name.bytes.dec.json"), self.names)
-        write_json(str(ef / "CARD_Desc.bytes.dec.json"), self.descs)
+        write_json(self.names, jn)
+        write_json(self.descs, jd)
+        write_cache(cache, key, (self.indx_bytes, self.names, self.descs))
 
-        # load braced if exists and compute effect_counts
-        if braced_j.exists():
-            try:
-                braced_raw = json.loads(braced_j.read_text(encoding="utf-8"))
-                from core.brace_utils import count_top_level_braces
-                # compute counts from real braced strings
-                self.effect_counts = [count_top_level_braces(s) for s in braced_raw]
-                # display version escapes double-quotes so GUI shows \"Name\" explicitly
-                self.braced_descs = [s.replace('"', '\\"') for s in braced_raw]
-            except Exception:
-                # fallback
-                self.braced_descs = [d for d in self.descs]
-                self.effect_counts = [0 for _ in self.descs]
-        else:
-            self.braced_descs = [d for d in self.descs]
-            self.effect_counts = [0 for _ in self.descs]
+        self._load_braced(braced_j)
 
     def write_changed(self, changed_folder: Path):
         changed_folder.mkdir(parents=True, exist_ok=True)
-        write_json(str(changed_folder / "CARD_Name.bytes.dec.json"), self.names)
-        write_json(str(changed_folder / "CARD_Desc.bytes.dec.json"), self.descs)
\ No newline at end of file
+        write_json(self.names, changed_folder / "CARD_Name.bytes.dec.json")
+        write_json(self.descs, changed_folder / "CARD_Desc.bytes.dec.json")
\ No newline at end of file
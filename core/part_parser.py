@@ -5,55 +5,92 @@ helpers for brace indices similar to community tool.
 Functions:
 - get_pidx_table(pidx_dec_path)
 - get_part_table(part_dec_path, pidx_table)
+- load_part_table(pidx_dec_path, part_dec_path)  (cached until either file changes)
 - unbraced_brace_indices(text)  (to compute indices of sub-effects)
 """
+from functools import lru_cache
 from pathlib import Path
+import re
+import struct
 
 nul = b'\x00'
+_PIDX_RECORD = struct.Struct("<HxB")
+_BRACE = re.compile(rb"[{}]")
 
 def get_pidx_table(pidx_dec_path: Path):
     pidx = pidx_dec_path.read_bytes()
-    pidx_table = [None] * (len(pidx) // 4)
-    pidx_table[0] = (0, 0, 0)
-    for i in range(4, len(pidx), 4):
-        index_in_Card_Part_file = pidx[i] + pidx[i+1] * 256
-        main_effect_part_count, sub_n_pend_effect_part_count = divmod(pidx[i+3], 16)
-        pidx_table[i // 4] = (index_in_Card_Part_file, main_effect_part_count, sub_n_pend_effect_part_count)
-    return pidx_table[1:]
+    # after a 4-byte header, each record is (u16 LE index into Card_Part, unused
+    # byte, main effect part count << 4 | sub/pendulum effect part count)
+    records = memoryview(pidx)[4:len(pidx) // 4 * 4]
+    return [(index_in_Card_Part_file, *divmod(counts, 16))
+            for index_in_Card_Part_file, counts in _PIDX_RECORD.iter_unpack(records)]
 
 def get_part_table(part_dec_path: Path, pidx_table):
     part = part_dec_path.read_bytes()
+    # the file is a flat array of (lo, hi) u16 LE pairs: decode it in one go and
+    # slice each card's run out of it
+    vals = struct.unpack_from("<%dH" % (len(part) // 2), part)
     part_table = [[] for _ in range(len(pidx_table))]
-    for i, (a, b, c) in enumerate(pidx_table):
-        if a == b == c == 0:
-            continue
-        for j in range(a, a + b + c):
-            k = 4 * j
-            lo = part[k + 0] + part[k + 1] * 256
-            hi = part[k + 2] + part[k + 3] * 256
-            part_table[i].append((lo, hi))
+    # most cards have no parts: pick the rows that do in one comprehension and
+    # only run the slicing for those
+    with_parts = [(i, a, b + c) for i, (a, b, c) in enumerate(pidx_table) if b or c]
+    for i, a, n in with_parts:
+        lo, hi = 2 * a, 2 * (a + n)
+        if hi > len(vals):
+            raise IndexError(f"Card_Part has no parts {a}..{a + n - 1} for card {i}")
+        part_table[i] = list(zip(vals[lo:hi:2], vals[lo + 1:hi:2]))
     return part_table
 
+@lru_cache(maxsize=8)
+def _cached_part_table(pidx_path: str, pidx_mtime: int, part_path: str, part_mtime: int):
+    return get_part_table(Path(part_path), get_pidx_table(Path(pidx_path)))
+
+def load_part_table(pidx_dec_path: Path, part_dec_path: Path):
+    """
+    get_part_table for the given Pidx/Part files, parsed once and reused until
+    either file changes (keyed on path + mtime). The result is shared between
+    callers and must not be mutated.
+    """
+    pidx_dec_path, part_dec_path = Path(pidx_dec_path), Path(part_dec_path)
+    return _cached_part_table(str(pidx_dec_path), pidx_dec_path.stat().st_mtime_ns,
+                              str(part_dec_path), part_dec_path.stat().st_mtime_ns)
+
 def unbraced_brace_indices(in_str: str):
     """
     For a string WITHOUT braces return list mapping each unbraced char
     to positions of braces as in the original community tool.
     Implementation replicates logic used in common_defs.unbraced_brace_indices.
     """
-    ans = []
-    j = -1
+    # callers adjust the returned list in place, so hand out a fresh copy
+    return list(_brace_indices(in_str))
+
+# keyed on the text itself: saving again re-maps the same original and mostly
+# unchanged descriptions, which then are not rescanned
+@lru_cache(maxsize=1 << 15)
+def _brace_indices(in_str: str):
+    # Only the braces are visited. With nb the number of non-brace bytes before a
+    # brace, a '}' maps to the last char before it (nb - 1). A '{' (or a '}' with
+    # nothing before it) maps to the next char after it (nb), but only if no
+    # other '}' comes first; otherwise, or at the end of the text, it stays -1.
     b = in_str.encode()
-    for i, c in enumerate(b):
-        is_L = c == 123
-        is_R = c == 125
-        if is_L:
-            ans.append(-1)
-        elif is_R:
-            ans.append(j)
+    total = len(b) - b.count(b'{') - b.count(b'}')
+    ans = []
+    pending = []
+    last_nb = 0
+    for n, m in enumerate(_BRACE.finditer(b)):
+        nb = m.start() - n
+        if pending and nb > last_nb:
+            for k in pending:
+                ans[k] = last_nb
+            pending = []
+        if m.group() == b'}' and nb:
+            ans.append(nb - 1)
+            pending = []
         else:
-            j += 1
-            for k in range(len(ans) - 1, -1, -1):
-                if ans[k] != -1:
-                    break
-                ans[k] = j
-    return ans
\ No newline at end of file
+            pending.append(len(ans))
+            ans.append(-1)
+        last_nb = nb
+    if pending and total > last_nb:
+        for k in pending:
+            ans[k] = last_nb
+    return tuple(ans)
@@ -1,9 +1,11 @@
 # quick test script for AssetFinder.find_many
 # Usage (from project root):
 #   python -m core.test_find "D:\\path\\to\\0000"
+import itertools
 import sys
 from pathlib import Path
 from core.asset_finder import AssetFinder
+from core.utils import file_walker
 
 def main():
     if len(sys.argv) < 2:
@@ -31,13 +33,8 @@ def main():
     p = Path(path)
     if p.exists():
         print("\nSample files under the folder (first 20):")
-        i = 0
-        for f in p.rglob("*"):
-            if f.is_file():
-                print(f)
-                i += 1
-                if i >= 20:
-                    break
+        for f in itertools.islice(file_walker(p), 20):
+            print(f)
     else:
         print("Provided path does not exist:", path)
     return 0
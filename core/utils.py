@@ -8,13 +8,39 @@ import shutil
 import sys
 import subprocess
 import os
+import hashlib
 import json
+import pickle
 from typing import Any, Iterable
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _iter_file_entries(folder):
+    """
+    Recursively yield os.DirEntry objects for the files under folder. scandir
+    returns the entry type with the listing, so no per-file stat is needed.
+    Directories are walked from an explicit stack: one scandir handle open at a
+    time and no chain of nested generators to pass every entry up through.
+    Unreadable directories are skipped.
+    """
+    stack = [folder]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            continue
+
 def file_walker(source_folder: Path):
-    for p in source_folder.rglob("*"):
-        if p.is_file():
-            yield p
+    for entry in _iter_file_entries(source_folder):
+        yield Path(entry.path)
 
 def ensure_dir(path: Path):
     path.mkdir(parents=True, exist_ok=True)
@@ -36,18 +62,28 @@ def copy_path(src, dst):
     dst.parent.mkdir(parents=True, exist_ok=True)
     shutil.copy2(src, dst)
 
-def copy_folder(src, dst, exclude_patterns=None):
+def copy_folder(src, dst, exclude_patterns=None, preserve_meta: bool = False):
+    """
+    Copy every file under src to the same relative path under dst. Only the
+    contents are copied (shutil.copyfile, which uses the OS fast-copy path)
+    unless preserve_meta asks for copy2's timestamps and permission bits too.
+    """
+    copy = shutil.copy2 if preserve_meta else shutil.copyfile
     src = Path(src)
     dst = Path(dst)
     exclude_patterns = exclude_patterns or []
-    for p in src.rglob("*"):
-        rel = p.relative_to(src)
-        if any(rel.match(pat) for pat in exclude_patterns):
+    root = os.fspath(src)
+    made = set()
+    for entry in _iter_file_entries(root):
+        rel = os.path.relpath(entry.path, root)
+        if exclude_patterns and any(Path(rel).match(pat) for pat in exclude_patterns):
             continue
-        target = dst / rel
-        target.parent.mkdir(parents=True, exist_ok=True)
-        if p.is_file():
-            shutil.copy2(p, target)
+        target = os.path.join(dst, rel)
+        parent = os.path.dirname(target)
+        if parent not in made:
+            os.makedirs(parent, exist_ok=True)
+            made.add(parent)
+        copy(entry.path, target)
 
 def truncate_for_list(s: str, n=60):
     if len(s) <= n:
@@ -55,23 +91,100 @@ def truncate_for_list(s: str, n=60):
     return s[:n-3] + "..."
 
 # JSON helpers used by other modules
+def dumps_json(obj: Any, indent: int = 2) -> bytes:
+    """
+    UTF-8 encoded JSON of obj with non-ASCII characters kept as is, the same
+    text json.dumps(ensure_ascii=False, indent=indent) gives. Uses orjson when
+    it is installed (it only indents by 2) and the object is serializable by it.
+    """
+    if orjson is not None and indent == 2:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, which only the stdlib encoder handles
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=indent).encode("utf-8")
+
+def loads_json(data: bytes):
+    """
+    Parse UTF-8 JSON bytes, with orjson when it is installed.
+    """
+    return (orjson or json).loads(data)
+
 def write_json(obj: Any, dest: Path | str, ensure_ascii: bool = False, indent: int = 2):
     """
     Write Python object as JSON to dest.
-    dest can be a Path or string.
+    dest can be a Path or string. The data goes to a temp file that then
+    replaces dest, so dest is never left half-written.
     """
     dest = Path(dest)
     dest.parent.mkdir(parents=True, exist_ok=True)
-    with open(dest, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=ensure_ascii, indent=indent)
+    if ensure_ascii:
+        data = json.dumps(obj, ensure_ascii=True, indent=indent).encode("ascii")
+    else:
+        data = dumps_json(obj, indent=indent)
+    tmp = dest.with_name(dest.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, dest)
 
 def read_json(src: Path | str):
     """
     Read JSON from src and return Python object.
     """
-    src = Path(src)
-    with open(src, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return loads_json(Path(src).read_bytes())
+
+# Pickle caches: a parsed result stored with a key derived from its sources
+# (e.g. size + mtime), reused while the key still matches. They live in the
+# per-user cache dir, never in a data folder that may be shared or exported,
+# since unpickling a file runs whatever it contains.
+def user_cache_dir() -> Path:
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "mdtext"
+
+def cache_path(source: Path | str, tag: str) -> Path:
+    """
+    Cache file for source (a file or folder) in user_cache_dir(), named from
+    its resolved path.
+    """
+    digest = hashlib.blake2b(os.fsencode(Path(source).resolve()), digest_size=16).hexdigest()
+    return user_cache_dir() / f"{digest}.{tag}"
+
+def read_cache(cache: Path, key: bytes):
+    """
+    Value stored in cache under key, or None if the cache is missing, stale
+    (stored with another key) or unreadable. The key is compared before
+    anything is unpickled.
+    """
+    try:
+        data = Path(cache).read_bytes()
+    except OSError:
+        return None
+    if data[:len(key)] != key:
+        return None
+    try:
+        return pickle.loads(data[len(key):])
+    except Exception:
+        # truncated or written by an incompatible version
+        return None
+
+def write_cache(cache: Path, key: bytes, value: Any):
+    """
+    Best-effort store of value under key; written to a temp file first so a
+    crash never leaves half a cache.
+    """
+    cache = Path(cache)
+    tmp = cache.with_name(cache.name + ".tmp")
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(key + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, cache)
+    except OSError:
+        pass
 
 # Convenience: write binary file safely
 def write_bytes(dest: Path | str, data: bytes):
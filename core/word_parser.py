@@ -4,25 +4,27 @@ Simple word table parser for WORD_Text + WORD_Indx pair.
 This module loads WORD_Indx.dec (4-byte LE indices) and WORD_Text.dec and creates a word table list.
 It also supports writing modified word table back to binary with padding to 4 bytes.
 """
+from itertools import accumulate
 from pathlib import Path
 from typing import List
+import struct
 
 def load_widx_table(widx_path: Path) -> List[int]:
     b = widx_path.read_bytes()
-    ints = []
-    for i in range(0, len(b), 4):
-        ints.append(int.from_bytes(b[i:i+4], "little"))
-    return ints
+    return list(struct.unpack_from(f"<{len(b) // 4}I", b))
 
-def load_word_table(widx_path: Path, word_path: Path):
+def load_word_table(widx_path: Path, word_path: Path, copy: bool = False):
+    """
+    Words between consecutive WORD_Indx offsets. They are zero-copy memoryview
+    slices of the WORD_Text bytes (write_word_table takes them as is); pass
+    copy=True to get independent bytes objects instead.
+    """
     widx = load_widx_table(widx_path)
     data = word_path.read_bytes()
-    words = []
-    for i in range(len(widx) - 1):
-        a = widx[i]
-        b = widx[i + 1]
-        words.append(data[a:b])
-    return words
+    if copy:
+        return [data[a:b] for a, b in zip(widx, widx[1:])]
+    mv = memoryview(data)
+    return [mv[a:b] for a, b in zip(widx, widx[1:])]
 
 def nul_pad(b: bytes):
     while len(b) % 4 != 0:
@@ -30,14 +32,8 @@ def nul_pad(b: bytes):
     return b
 
 def write_word_table(words: List[bytes], out_word_path: Path, out_widx_path: Path):
-    widx = [0]
-    buf = bytearray()
-    for w in words:
-        buf.extend(w)
-        widx.append(widx[-1] + len(w))
-    out_word_path.write_bytes(bytes(buf))
+    # offsets are the running sum of word lengths; the text is joined in one go
+    widx = [0, *accumulate(map(len, words))]
+    out_word_path.write_bytes(b"".join(words))
     # write widx as 4byte LE
-    idx_buf = bytearray()
-    for i in widx:
-        idx_buf.extend(i.to_bytes(4, "little"))
-    out_widx_path.write_bytes(bytes(idx_buf))
\ No newline at end of file
+    out_widx_path.write_bytes(struct.pack(f"<{len(widx)}I", *widx))
\ No newline at end of file
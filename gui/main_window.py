@@ -18,8 +18,10 @@ if ROOT_STR not in sys.path:
 
 import os
 import threading
-import json
+import queue
 import zipfile
+from bisect import bisect_right
+from itertools import accumulate
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -36,6 +38,12 @@ OUTPUT = APP_ROOT / "output"
 EXTRACTED = OUTPUT / "extracted"
 CHANGED = OUTPUT / "changed"
 ASSETS = APP_ROOT / "assets"
+UI_DRAIN_MS = 50
+UI_DRAIN_MAX = 200
+SEARCH_DEBOUNCE_MS = 150
+ZIP_COMPRESSLEVEL = 1
+# half-written temp files (atomic JSON saves, an export in progress) are not data
+ZIP_SKIP_SUFFIXES = (".tmp",)
 
 REQUIRED_ASSETS = [
     ("CARD_Desc", "CARD_Desc"),
@@ -55,22 +63,29 @@ class MainWindow(ttk.Frame):
         apply_theme(master)
         self.master = master
         self.pack(fill="both", expand=True)
+        self._sample_pending = False
+        # _load_extracted calls may overlap (sample vs. real data on worker
+        # threads); only the most recently started one is shown
+        self._load_gen = 0
+        self._load_lock = threading.Lock()
         self._create_widgets()
         self.extracted_folder = EXTRACTED
         self.changed_folder = CHANGED
         self.search_results = {}
         self.card_names = []
+        self._search_text = ""   # lowercased names joined by NUL, rebuilt with the list
+        self._search_ends = []   # offset just past each name's separator in _search_text
+        self._display_strings = []   # listbox row text per card
         self.card_descs = []     # current (braced) descriptions displayed/edited
         self.orig_descs = []     # original unbraced descriptions (for reference)
+        common_defs.ensure_project_dirs()
         OUTPUT.mkdir(exist_ok=True)
         EXTRACTED.mkdir(exist_ok=True, parents=True)
         CHANGED.mkdir(exist_ok=True, parents=True)
 
-        # load sample if present
+        # load sample if present, the first time the Edit tab is shown
         sample_json = ASSETS / "sample_data" / "CARD_Desc.bytes.dec.json"
-        if sample_json.exists():
-            self.log("Sample data found. Loading sample dataset.")
-            self._load_extracted(ASSETS / "sample_data")
+        self._sample_pending = sample_json.exists()
 
     # --- UI creation (same layout, unchanged) ---
     def _create_widgets(self):
@@ -84,6 +99,7 @@ class MainWindow(ttk.Frame):
 
         notebook = ttk.Notebook(self)
         notebook.pack(fill="both", expand=True, padx=8, pady=(0,8))
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         self.tab_extract = ttk.Frame(notebook)
         notebook.add(self.tab_extract, text="Extract")
@@ -104,6 +120,10 @@ class MainWindow(ttk.Frame):
         scrollbar = ttk.Scrollbar(bottom, command=self.log_text.yview)
         scrollbar.pack(side="right", fill="y")
         self.log_text['yscrollcommand'] = scrollbar.set
+        # worker threads never touch Tk: they queue UI events that the main
+        # loop applies in batches
+        self._ui_queue = queue.SimpleQueue()
+        self.after(UI_DRAIN_MS, self._drain_ui_queue)
         self.progress = ttk.Progressbar(self, orient="horizontal", mode="determinate")
         self.progress.pack(fill="x", padx=8, pady=(0,8))
 
@@ -127,6 +147,9 @@ class MainWindow(ttk.Frame):
         top.pack(fill="x", padx=8, pady=6)
         ttk.Label(top, text="Search (ID or name):").pack(side="left")
         self.search_var = tk.StringVar()
+        # search as you type, once typing pauses
+        self._search_after_id = None
+        self.search_var.trace_add("write", lambda *args: self._schedule_search())
         ttk.Entry(top, textvariable=self.search_var, width=40).pack(side="left", padx=6)
         ttk.Button(top, text="Search", command=self._on_search).pack(side="left", padx=6)
         ttk.Button(top, text="Reload extracted", command=self._reload_extracted).pack(side="left", padx=6)
@@ -155,18 +178,67 @@ class MainWindow(ttk.Frame):
         frame = self.tab_repack
         ttk.Label(frame, text="Repack / Encrypt").pack(anchor="nw", padx=8, pady=6)
         ttk.Button(frame, text="Build Mod Files (1-click)", command=self._build_mod_files).pack(padx=8, pady=4, anchor="nw")
-        ttk.Button(frame, text="Export ZIP", command=self._export_zip).pack(padx=8, pady=4, anchor="nw")
+        self.export_zip_button = ttk.Button(frame, text="Export ZIP", command=self._export_zip)
+        self.export_zip_button.pack(padx=8, pady=4, anchor="nw")
         ttk.Button(frame, text="Open mod output folder", command=lambda: utils.open_path(OUTPUT)).pack(padx=8, pady=4, anchor="nw")
 
     # --- Logging / progress ---
     def log(self, s):
-        self.log_text.insert("end", s + "\n")
-        self.log_text.see("end")
+        self._ui_queue.put(("log", s))
 
     def set_progress(self, value, maximum=None):
-        if maximum:
-            self.progress['maximum'] = maximum
-        self.progress['value'] = value
+        self._ui_queue.put(("progress", value, maximum))
+
+    def _post(self, fn, *args):
+        # run fn(*args) on the Tk main loop
+        self._ui_queue.put(("call", fn, args))
+
+    def _drain_ui_queue(self):
+        try:
+            self._apply_ui_events()
+        finally:
+            # always re-arm, or every later update would stay queued
+            self.after(UI_DRAIN_MS, self._drain_ui_queue)
+
+    def _apply_ui_events(self):
+        lines = []
+        progress = None
+        for _ in range(UI_DRAIN_MAX):
+            try:
+                event = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            kind = event[0]
+            if kind == "log":
+                lines.append(event[1])
+            elif kind == "progress":
+                # only the latest value matters; keep any new maximum
+                if progress and not event[2]:
+                    event = (kind, event[1], progress[2])
+                progress = event
+            elif kind == "tree":
+                self.extract_tree.delete(*self.extract_tree.get_children())
+                for values in event[1]:
+                    self.extract_tree.insert("", "end", values=values)
+            elif kind == "call":
+                # show what came before first: the call may open a modal dialog
+                self._show_ui_batch(lines, progress)
+                lines, progress = [], None
+                try:
+                    event[1](*event[2])
+                except Exception as e:
+                    lines.append(f"UI update failed: {e}")
+        self._show_ui_batch(lines, progress)
+
+    def _show_ui_batch(self, lines, progress):
+        if progress:
+            if progress[2]:
+                self.progress['maximum'] = progress[2]
+            self.progress['value'] = progress[1]
+        # one insert + scroll per batch instead of a redraw per log line
+        if lines:
+            self.log_text.insert("end", "\n".join(lines) + "\n")
+            self.log_text.see("end")
 
     # --- Actions ---
     def browse_folder(self):
@@ -189,21 +261,23 @@ class MainWindow(ttk.Frame):
         thread.start()
 
     def _extract_all_thread(self, folder: Path):
+        # writes into the copied-files folder; recreate any removed since startup
+        common_defs.ensure_project_dirs()
         self.log("Starting search & extract...")
         targets = [name for name, _ in REQUIRED_ASSETS]
         # fast multi_search uses built-in hex-name mapping or step_1_config.txt
         results = asset_finder.multi_search(folder, targets, logger=self.log)
         self.search_results = {targets[i]: results[i] for i in range(len(targets))}
         # populate tree
-        for i in self.extract_tree.get_children():
-            self.extract_tree.delete(i)
+        rows = []
         for k, v in self.search_results.items():
             if v:
-                self.extract_tree.insert("", "end", values=(str(v['path']), v['size'], v['container']))
+                rows.append((str(v['path']), v['size'], v['container']))
                 self.log(f"Found {k}: {v['path']} ({v['size']} bytes) in {v['container']}")
             else:
-                self.extract_tree.insert("", "end", values=(f"NOT FOUND: {k}", "-", "-"))
+                rows.append((f"NOT FOUND: {k}", "-", "-"))
                 self.log(f"Missing {k}")
+        self._ui_queue.put(("tree", rows))
 
         # Copy found Unity container files into common_defs.copied_files_folder/0000/... for compatibility
         copied_root = Path(common_defs.copied_files_folder)
@@ -223,14 +297,11 @@ class MainWindow(ttk.Frame):
         # Extract each found container (unpack assets) into EXTRACTED
         EXTRACTED.mkdir(parents=True, exist_ok=True)
         files_to_extract = [v['path'] for v in self.search_results.values() if v]
-        total = len(files_to_extract)
-        self.set_progress(0, total)
-        for idx, fp in enumerate(files_to_extract, start=1):
-            try:
-                asset_unpacker.unpack_single_asset(Path(fp), EXTRACTED, logger=self.log)
-            except Exception as e:
-                self.log(f"Error extracting {fp}: {e}")
-            self.set_progress(idx)
+        self.set_progress(0, len(files_to_extract))
+        # containers are parsed in parallel worker processes
+        asset_unpacker.unpack_assets([Path(fp) for fp in files_to_extract], EXTRACTED, logger=self.log,
+                                     progress_callback=lambda done, total: self.set_progress(done),
+                                     names=targets)
         self.log("Extraction complete.")
         # After extraction, prepare braced descriptions and load into Edit tab
         self._load_extracted(EXTRACTED)
@@ -258,6 +329,11 @@ class MainWindow(ttk.Frame):
             self.log(f"Error: {e}")
 
     def _load_extracted(self, extracted_path: Path):
+        # real data loaded first: the sample is no longer wanted
+        self._sample_pending = False
+        with self._load_lock:
+            self._load_gen += 1
+            gen = self._load_gen
         self.log("Loading extracted data...")
         try:
             name_file = Path(extracted_path) / "CARD_Name.bytes.dec.json"
@@ -271,8 +347,7 @@ class MainWindow(ttk.Frame):
             # Try to find existing braced file generated by earlier step_2; if missing create one
             braced_file = Path(extracted_path) / "!Braced CARD_Desc.bytes.dec.json"
             if braced_file.exists():
-                with open(braced_file, encoding="utf-8") as f:
-                    braced_descs = json.load(f)
+                braced_descs = utils.read_json(braced_file)
                 self.log("Loaded existing braced descriptions.")
             else:
                 # use Card_Pidx/Card_Part to build braced view
@@ -281,48 +356,90 @@ class MainWindow(ttk.Frame):
                 if pidx.exists() and part.exists():
                     braced_descs = card_parser.build_braced_descs(descs, pidx, part)
                     # write a braced file to extracted for convenience
-                    with open(braced_file, "w", encoding="utf-8") as f:
-                        json.dump(braced_descs, f, ensure_ascii=False, indent=2)
+                    utils.write_json(braced_descs, braced_file)
                     self.log("Generated braced descriptions from Card_Pidx/Card_Part.")
                 else:
                     # fallback: show unbraced but still editable
                     braced_descs = descs.copy()
                     self.log("No part/pidx to compute braces; using unbraced descriptions.")
-            # load into GUI data structures
-            self.card_names = names
-            self.card_descs = braced_descs
-            self.orig_descs = descs
             # if user previously saved changed braced file, prefer that (from CHANGED)
             changed_braced = CHANGED / "!Changed !Braced CARD_Desc.bytes.dec.json"
             if changed_braced.exists():
-                with open(changed_braced, encoding="utf-8") as f:
-                    changed_list = json.load(f)
-                # override the in-memory descs with changed ones
-                self.card_descs = changed_list
+                braced_descs = utils.read_json(changed_braced)
                 self.log("Found changed braced file; using changed descriptions.")
-            self._populate_card_list()
-            self.log(f"Loaded {len(self.card_names)} cards.")
+            # may run on a worker thread; the data is swapped in on the main loop
+            self._post(self._show_loaded, gen, names, braced_descs, descs)
         except Exception as e:
             self.log(f"Failed to load extracted data: {e}")
 
+    def _show_loaded(self, gen, names, braced_descs, descs):
+        if gen != self._load_gen:
+            # a later load was started while this one ran
+            self.log("Discarded data from an earlier, superseded load.")
+            return
+        # load into GUI data structures
+        self.card_names = names
+        self.card_descs = braced_descs
+        self.orig_descs = descs
+        self._populate_card_list()
+        self.log(f"Loaded {len(self.card_names)} cards.")
+
     def _populate_card_list(self):
+        # call whenever card_names changes: rebuilds the search index and row labels
+        self._build_search_index()
+        self._display_strings = [f"{i:05d} - {utils.truncate_for_list(name, 60)}"
+                                 for i, name in enumerate(self.card_names)]
+        self._show_all_cards()
+
+    def _show_all_cards(self):
         self.card_listbox.delete(0, "end")
-        for i, name in enumerate(self.card_names):
-            display = f"{i:05d} - {utils.truncate_for_list(name, 60)}"
-            self.card_listbox.insert("end", display)
+        # one variadic insert is a single Tcl call instead of one per row
+        self.card_listbox.insert("end", *self._display_strings)
+
+    def _on_tab_changed(self, evt):
+        if not self._sample_pending or evt.widget.select() != str(self.tab_edit):
+            return
+        self._sample_pending = False
+        self.log("Sample data found. Loading sample dataset.")
+        threading.Thread(target=self._load_extracted, args=(ASSETS / "sample_data",), daemon=True).start()
+
+    def _schedule_search(self):
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._on_search)
 
     def _on_search(self):
+        if self._search_after_id:
+            # run now instead of on the pending timer
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
         q = self.search_var.get().strip().lower()
         if not q:
-            self._populate_card_list()
+            # names are unchanged, so the cached rows are still valid
+            self._show_all_cards()
             return
+        text, ends = self._search_text, self._search_ends
         hits = []
-        for i, name in enumerate(self.card_names):
-            if q in name.lower() or q == str(i):
-                hits.append((i, name))
+        pos = text.find(q)
+        while pos != -1:
+            i = bisect_right(ends, pos)
+            hits.append(i)
+            # skip the rest of this name so each card is listed once
+            pos = text.find(q, ends[i])
+        if q.isascii() and q.isdecimal() and q == str(int(q)) and int(q) < len(self.card_names):
+            i = int(q)
+            k = bisect_right(hits, i)
+            if not (k and hits[k - 1] == i):
+                hits.insert(k, i)
+        displays = self._display_strings
         self.card_listbox.delete(0, "end")
-        for i, name in hits:
-            self.card_listbox.insert("end", f"{i:05d} - {utils.truncate_for_list(name, 60)}")
+        self.card_listbox.insert("end", *[displays[i] for i in hits])
+
+    def _build_search_index(self):
+        """Join the lowercased names once so a search is a few str.find calls."""
+        lowered = [name.lower() for name in self.card_names]
+        self._search_text = "\x00".join(lowered)
+        self._search_ends = list(accumulate(len(name) + 1 for name in lowered))
 
     def _reload_extracted(self):
         self._load_extracted(self.extracted_folder)
@@ -363,8 +480,7 @@ class MainWindow(ttk.Frame):
         CHANGED.mkdir(parents=True, exist_ok=True)
         # save names changed JSON (simple copy of CARD_Name.dec.json but changed entries)
         name_out = CHANGED / "CARD_Name.bytes.dec.json"
-        with open(name_out, "w", encoding="utf-8") as f:
-            json.dump(self.card_names, f, ensure_ascii=False, indent=2)
+        utils.write_json(self.card_names, name_out)
         # save braced changed
         braced_out = card_parser.save_changed_braced(CHANGED, self.card_descs)
         # create unbraced changed and save
@@ -378,8 +494,7 @@ class MainWindow(ttk.Frame):
                 # use original braced (before change) — orig_braced computed earlier if any
                 orig_braced_file = Path(EXTRACTED) / "!Braced CARD_Desc.bytes.dec.json"
                 if orig_braced_file.exists():
-                    with open(orig_braced_file, encoding="utf-8") as f:
-                        orig_braced = json.load(f)
+                    orig_braced = utils.read_json(orig_braced_file)
                 else:
                     # if not exists, build from orig descs
                     orig_braced = card_parser.build_braced_descs(self.orig_descs, pidx_src, part_src)
@@ -423,20 +538,58 @@ class MainWindow(ttk.Frame):
             self.log("Running step_4_mod_the_files.py ...")
             subprocess.check_call(["python", str(step4_script)], cwd=str(APP_ROOT))
             self.log("step_4_mod_the_files.py finished.")
-            messagebox.showinfo("Done", f"Built mod files in {common_defs.modded_folder}")
+            self._post(messagebox.showinfo, "Done", f"Built mod files in {common_defs.modded_folder}")
         except subprocess.CalledProcessError as e:
             self.log(f"Error building mod files: {e}")
-            messagebox.showerror("Error", str(e))
+            self._post(messagebox.showerror, "Error", str(e))
 
     def _export_zip(self):
         out = filedialog.asksaveasfilename(defaultextension=".zip", filetypes=[("Zip files", "*.zip")])
         if not out:
             return
-        out = Path(out)
+        # compressing the whole output folder takes a while; keep Tk responsive,
+        # with one export at a time
+        self.export_zip_button.state(["disabled"])
+        thread = threading.Thread(target=self._export_zip_thread, args=(Path(out),), daemon=True)
+        thread.start()
+
+    def _export_zip_thread(self, out: Path):
+        try:
+            self._write_zip(out)
+        finally:
+            self._post(self.export_zip_button.state, ["!disabled"])
+
+    def _write_zip(self, out: Path):
         base = OUTPUT
-        with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as z:
-            for root, dirs, files in os.walk(base):
-                for f in files:
-                    fp = Path(root) / f
-                    z.write(fp, fp.relative_to(base))
-        messagebox.showinfo("Exported", f"Exported ZIP to {out}")
+        self.log(f"Exporting ZIP to {out} ...")
+        # built under a temp name and renamed when complete, so an export that
+        # fails or is cut short by closing the app never leaves a truncated ZIP
+        tmp = out.with_name(out.name + ".tmp")
+        try:
+            # a low DEFLATE level: much less CPU on the JSON/.dec bulk for a few % size.
+            # z.write streams each file into the archive and switches an entry to
+            # ZIP64 from its size, so large extractions are not held in memory.
+            with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED, allowZip64=True,
+                                 compresslevel=ZIP_COMPRESSLEVEL) as z:
+                for root, dirs, files in os.walk(base, followlinks=False):
+                    # plain string paths: no Path object per file
+                    for f in files:
+                        if f.endswith(ZIP_SKIP_SUFFIXES):
+                            continue
+                        fp = os.path.join(root, f)
+                        # encrypted .bytes payloads are zlib streams already and
+                        # do not shrink; store them instead of deflating again
+                        compress_type = zipfile.ZIP_STORED if f.endswith(".bytes") else None
+                        z.write(fp, os.path.relpath(fp, base), compress_type=compress_type)
+            os.replace(tmp, out)
+        except Exception as e:
+            # OSError, but also ValueError (pre-1980 mtimes) or LargeZipFile from z.write
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            self.log(f"Failed to export ZIP: {e}")
+            self._post(messagebox.showerror, "Error", str(e))
+            return
+        self.log("ZIP export finished.")
+        self._post(messagebox.showinfo, "Exported", f"Exported ZIP to {out}")
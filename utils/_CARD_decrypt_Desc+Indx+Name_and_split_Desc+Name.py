@@ -7,6 +7,7 @@ timelic: https://github.com/timelic/master-duel-chinese-translation-switch
 from typing import List
 import json
 import os
+import struct
 import sys
 import zlib
 
@@ -147,38 +148,19 @@ def ProgressiveProcessing(CARD_Indx_filename, filename, start):
 
     # Read binary index
     with open(CARD_Indx_filename + ".dec", "rb") as f:
-        hex_str_list = ("{:02X}".format(int(c))
-                        for c in f.read())  # Define variables to accept file contents
-    dec_list = [int(s, 16) for s in hex_str_list]  # Convert hexadecimal to decimal
-
-    # Get the index of Desc
-    indx = []
-    for i in range(start, len(dec_list), 8):
-        tmp = []
-        for j in range(4):
-            tmp.append(dec_list[i + j])
-        indx.append(tmp)
-
-    def FourToOne(x: List[int]) -> int:
-        res = 0
-        for i in range(3, -1, -1):
-            res *= 16 * 16
-            res += x[i]
-        return res
-
-    indx = [FourToOne(i) for i in indx]
+        indx_data = f.read()
+
+    # Get the index of Desc: every 8 bytes hold the little-endian uint32 offsets
+    # of Name (start 0) and Desc (start 4), unpacked in one call
+    indx = list(struct.unpack_from("<%dI" % (len(indx_data) // 4), indx_data)[start // 4::2])
     indx = indx[1:]
     	
     # Convert Decrypted CARD files to JSON files    
     def Solve(data: bytes, desc_indx: List[int]):
-        res = []
-        for i in range(len(desc_indx) - 1):
-            s = data[desc_indx[i]:desc_indx[i + 1]]
-            s = s.decode('UTF-8')
-            while len(s) > 0 and s[-1] == '\u0000':
-                s = s[:-1]
-            res.append(s)
-        return res
+        # strip the NUL padding on the bytes (one C-level scan) before decoding
+        mv = memoryview(data)
+        return [bytes(mv[a:b]).rstrip(b'\x00').decode('UTF-8')
+                for a, b in zip(desc_indx, desc_indx[1:])]
 
     # Read Desc file
     with open(f"{filename}" + ".dec", 'rb') as f:
@@ -8,6 +8,7 @@ https://bitbucket.org/timel/master-duel-chinese-translation-patch/src/master/%E5
 
 from typing import List
 import json
+import struct
 import sys
 import zlib
 
@@ -86,7 +87,8 @@ print('Finished reading files...')
 name_merge_string = "\u0000" * 8  # There are eight blanks at the beginning
 desc_merge_string = "\u0000" * 8
 
-merge_string = {"name": "\u0000" * 8, "desc": "\u0000" * 8}
+# Merged strings are collected as lists of utf-8 pieces and joined once at the end
+merge_string = {"name": [b"\x00" * 8], "desc": [b"\x00" * 8]}
 
 name_indx = [0]
 desc_indx = [0]
@@ -103,15 +105,14 @@ for i in range(len(CARD_Name_json)):  # Here because of a strange bug in English
         # Convert Chinese pendulum monster effects to Japanese format
         # if sentence.startswith('←'):
         #     sentence = solve_P_desc(sentence)
-        length = getStringLen(sentence)
+        data = sentence.encode('utf-8')
+        length = len(data)
         if i == 0:
             length += 8
         space_len = 4 - length % 4  # It means getting the remainder
         indx.append(indx[-1] + length + space_len)  # Record indx
-        if name_or_desc == "name":
-            merge_string["name"] += sentence + '\u0000' * space_len
-        else:
-            merge_string["desc"] += sentence + '\u0000' * space_len
+        merge_string[name_or_desc].append(data)
+        merge_string[name_or_desc].append(b'\x00' * space_len)
 
     helper(name, name_indx, "name", merge_string)
     helper(desc, desc_indx, "desc", merge_string)
@@ -136,17 +137,8 @@ for i in range(len(name_indx)):
 
 #print(card_indx)
 
-def intTo4Hex(num: int) -> List[int]:
-    res = []
-    for _ in range(4):
-        res.append(num % 256)
-        num //= 256
-    return res
-
-
-card_indx_merge = []
-for item in card_indx:
-    card_indx_merge.extend(intTo4Hex(item))
+# Every index is a little-endian uint32, packed in one call
+card_indx_merge = struct.pack('<%dI' % len(card_indx), *card_indx)
 
 print('Finished calculating index.')
 
@@ -156,11 +148,12 @@ def Decrypt(filename):
     with open(f'{filename}', "rb") as f:
         data = bytearray(f.read())
 
+    # (i + key + 0x23D) * key grows by key per byte: keep its low byte as a running sum
+    v = ((m_iCryptoKey + 0x23D) * m_iCryptoKey) & 0xFF
+    step = m_iCryptoKey & 0xFF
     for i in range(len(data)):
-        v = i + m_iCryptoKey + 0x23D
-        v *= m_iCryptoKey
-        v ^= i % 7
-        data[i] ^= v & 0xFF
+        data[i] ^= v ^ (i % 7)
+        v = (v + step) & 0xFF
 
     with open(f'{filename}' + ".dec", "wb") as f:
         f.write(zlib.decompress(data))
@@ -207,20 +200,19 @@ def encrypt(output_name, b: bytes):
 
     data = bytearray(zlib.compress(b))
 
+    # (i + key + 0x23D) * key grows by key per byte: keep its low byte as a running sum
+    v = ((m_iCryptoKey + 0x23D) * m_iCryptoKey) & 0xFF
+    step = m_iCryptoKey & 0xFF
     for i in range(len(data)):
-        v = i + m_iCryptoKey + 0x23D
-        v *= m_iCryptoKey
-        v ^= i % 7
-        data[i] ^= v & 0xFF
+        data[i] ^= v ^ (i % 7)
+        v = (v + step) & 0xFF
 
     with open(output_name, "wb") as f:
         f.write((data))
     f.close()
 
-encrypt(CARD_Name_filename,
-        bytes(merge_string["name"], encoding='utf-8'))
-encrypt(CARD_Desc_filename,
-        bytes(merge_string["desc"], encoding='utf-8'))
+encrypt(CARD_Name_filename, b''.join(merge_string["name"]))
+encrypt(CARD_Desc_filename, b''.join(merge_string["desc"]))
 encrypt(CARD_Indx_filename, bytes(card_indx_merge))
 
 print('Finished encrypting files.')
\ No newline at end of file